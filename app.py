@@ -2,13 +2,18 @@
 Panopticon - Lead Follow-up Management Dashboard
 Main Streamlit application entry point.
 """
+import hashlib
+import json
 import logging
 import platform
-from datetime import datetime, timezone
+import time
+from datetime import date, datetime, timezone
+from itertools import islice
+from operator import itemgetter
 
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow as pa
 import streamlit as st
 from streamlit_scroll_to_top import scroll_to_here
 
@@ -20,7 +25,15 @@ logging.basicConfig(
 
 from src.zoho_client import (
     get_leads_with_appointments,
+    get_cached_leads_with_appointments,
+    start_background_leads_fetch,
+    finish_background_leads_fetch,
+    start_background_deliveries_fetch,
+    finish_background_deliveries_fetch,
     get_stage_history,
+    get_stage_histories_batch,
+    get_notes_for_leads,
+    parse_zoho_date,
     get_deliveries,
     get_last_error,
     get_error_type,
@@ -30,16 +43,23 @@ from src.zoho_client import (
     clear_partial_error,
     ERROR_TYPE_AUTH,
 )
+from src.cache import (
+    get_leads_cache_age,
+    get_cached_deliveries,
+    get_today_snapshot,
+    save_status_snapshot,
+    clear_notes_cache,
+    clear_deliveries_cache,
+)
 from src.data_processing import (
     format_leads_for_display,
     format_last_updated,
     format_time_in_stage,
     format_stage_history,
-    get_status_emoji,
+    get_lead_status_emoji,
+    bucket_leads_by_status,
     sort_leads,
-    count_leads_by_status,
-    count_leads_by_stage,
-    get_locator_workload,
+    compute_status_aggregates,
     get_about_to_go_stale,
     get_closing_ratio_summary,
     get_closing_ratio_by_month,
@@ -115,6 +135,35 @@ st.markdown("""
         overflow-y: auto;
     }
 
+    /* Priority list tables (At Risk / Needs Attention) */
+    table.priority-table {
+        width: 100%;
+        border-collapse: collapse;
+        font-size: 0.9rem;
+        table-layout: fixed;
+    }
+    table.priority-table thead tr {
+        background: #f8f9fa;
+        text-align: left;
+    }
+    table.priority-table th {
+        padding: 8px;
+        border-bottom: 2px solid #dee2e6;
+    }
+    table.priority-table td {
+        padding: 8px;
+        border-bottom: 1px solid #eee;
+    }
+    table.priority-table th:nth-child(1) { width: 35%; }
+    table.priority-table th:nth-child(2) { width: 12%; }
+    table.priority-table th:nth-child(3) { width: 10%; }
+    table.priority-table th:nth-child(4) { width: 18%; }
+    table.priority-table th:nth-child(5) { width: 25%; }
+    table.priority-table a {
+        color: #1a73e8;
+        text-decoration: none;
+    }
+
     /* Lead card spacing */
     div[data-testid="stExpander"] {
         margin-bottom: 0.5rem;
@@ -130,6 +179,12 @@ st.markdown("""
         font-weight: 600;
     }
 
+    /* Hidden input the lead-link script uses to request off-page navigation */
+    .element-container:has(input[aria-label="Lead navigation"]),
+    div[data-testid="stElementContainer"]:has(input[aria-label="Lead navigation"]) {
+        display: none;
+    }
+
     /* Compact dataframe styling */
     .stDataFrame {
         font-size: 0.9rem;
@@ -172,10 +227,61 @@ if st.session_state.get("scroll_to_top", False):
 _scroll_to_param = st.query_params.get("scroll_to")
 if _scroll_to_param:
     st.session_state.scroll_to_lead = _scroll_to_param
+    st.session_state._scroll_page_pending = True  # Jump to the page holding this lead
     st.query_params.clear()
     st.rerun()
 
 
+def _session_cached(name: str, key, compute):
+    """Return a value memoized in session state, recomputing only when key changes.
+
+    Streamlit reruns the whole script on every widget interaction, so derived
+    data that only depends on the fetched leads and the filter settings is
+    stored alongside the key it was computed for (``_{name}_cache_key`` and
+    ``_{name}_data``, matching the display data cache).
+
+    Args:
+        name: Short name for the cached value (used to build session state keys)
+        key: Hashable fingerprint of every input the computation depends on
+        compute: Zero-argument callable producing the value on a cache miss
+
+    Returns:
+        The cached or freshly computed value
+    """
+    ss = st.session_state
+    key_name = f"_{name}_cache_key"
+    data_name = f"_{name}_data"
+    if ss.get(key_name) == key and data_name in ss:
+        return ss[data_name]
+
+    value = compute()
+    ss[key_name] = key
+    ss[data_name] = value
+    return value
+
+
+def _summary_key(summary: dict) -> tuple:
+    """Hashable fingerprint of a small aggregate (counts dict or column lists).
+
+    Figures built from an aggregate are keyed on its contents, so a filter or
+    sort change that leaves the summary unchanged reuses the cached figure.
+    """
+    return tuple(
+        (name, tuple(values) if isinstance(values, list) else values)
+        for name, values in summary.items()
+    )
+
+
+def _content_token(records: list[dict]) -> str:
+    """Return a stable content hash of fetched records for use in cache keys.
+
+    Computed once when data is stored, so display caches invalidate whenever any
+    field changes rather than only when the record count or end ids do.
+    """
+    payload = json.dumps(records, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 def fetch_and_cache_leads(bypass_cache: bool = False):
     """Fetch leads from Zoho CRM and cache in session state.
 
@@ -187,24 +293,36 @@ def fetch_and_cache_leads(bypass_cache: bool = False):
     Args:
         bypass_cache: If True, skip Supabase cache and fetch fresh from API
     """
-    from src.cache import get_leads_cache_age
-
-    # Check if we have existing cached data before fetch
-    had_cached_data = "leads" in st.session_state and st.session_state.leads
-
     # Clear partial error before fetch attempt
     clear_partial_error()
 
     # Attempt to fetch new data
     leads = get_leads_with_appointments(bypass_cache=bypass_cache)
+    return _store_fetched_leads(leads)
+
+
+def _store_fetched_leads(leads: list[dict]):
+    """Store the result of a leads fetch in session state.
+
+    Args:
+        leads: Leads returned by the fetch (empty list on failure)
+
+    Returns:
+        Leads now held in session state
+    """
+    now = datetime.now(timezone.utc)
+
+    # Check if we have existing cached data from before the fetch
+    had_cached_data = "leads" in st.session_state and st.session_state.leads
     error = get_last_error()
 
     if leads:
         # Success - update cache and clear errors
         st.session_state.leads = leads
+        st.session_state.leads_token = _content_token(leads)
         # Use cache timestamp if available, otherwise current time (fresh API call)
         cache_age = get_leads_cache_age()
-        st.session_state.last_refresh = cache_age if cache_age else datetime.now(timezone.utc)
+        st.session_state.last_refresh = cache_age if cache_age else now
         clear_error()
     elif had_cached_data and error:
         # Failed to fetch but have cached data - graceful degradation (AC#3)
@@ -213,12 +331,48 @@ def fetch_and_cache_leads(bypass_cache: bool = False):
     else:
         # No cached data - store empty list (error will be displayed)
         st.session_state.leads = []
-        st.session_state.last_refresh = datetime.now(timezone.utc)
+        st.session_state.leads_token = _content_token([])
+        st.session_state.last_refresh = now
 
     st.session_state.refreshing = False
     return st.session_state.get("leads", [])
 
 
+def _poll_background_leads_fetch() -> bool:
+    """Start or poll a non-blocking leads fetch for the initial page load.
+
+    Supabase-cached leads are used directly (a single fast query). On a cache
+    miss the COQL request runs on a worker thread and this returns False until
+    it resolves, so the caller can rerun instead of blocking in a spinner.
+
+    Returns:
+        True once the fetch result has been stored in session state
+    """
+    future = st.session_state.get("leads_future")
+
+    if future is None:
+        clear_partial_error()
+
+        cached_leads = get_cached_leads_with_appointments()
+        if cached_leads is not None:
+            _store_fetched_leads(cached_leads)
+            return True
+
+        future = start_background_leads_fetch()
+        if future is None:
+            # No access token - error already recorded by the client
+            _store_fetched_leads([])
+            return True
+        st.session_state.leads_future = future
+
+    if not future.done():
+        return False
+
+    del st.session_state.leads_future
+    _store_fetched_leads(finish_background_leads_fetch(future))
+    return True
+
+
 def fetch_and_cache_deliveries(bypass_cache: bool = False):
     """Fetch deliveries from Zoho CRM and cache in session state.
 
@@ -232,11 +386,84 @@ def fetch_and_cache_deliveries(bypass_cache: bool = False):
     if not bypass_cache and "deliveries" in st.session_state:
         return st.session_state.deliveries
 
-    deliveries = get_deliveries(bypass_cache=bypass_cache)
+    return _store_fetched_deliveries(get_deliveries(bypass_cache=bypass_cache))
+
+
+def _store_fetched_deliveries(deliveries: list[dict]) -> list[dict]:
+    """Store the result of a deliveries fetch in session state."""
     st.session_state.deliveries = deliveries
+    st.session_state.deliveries_token = _content_token(deliveries)
     return deliveries
 
 
+def _poll_background_deliveries_fetch() -> bool:
+    """Start or poll a non-blocking deliveries fetch alongside the leads fetch.
+
+    Mirrors _poll_background_leads_fetch(): Supabase-cached deliveries are
+    used directly, otherwise the COQL request runs on a worker thread so it
+    overlaps the leads request instead of waiting for it.
+
+    Returns:
+        True once deliveries are held in session state
+    """
+    future = st.session_state.get("deliveries_future")
+
+    if future is None:
+        if "deliveries" in st.session_state:
+            return True
+
+        cached_deliveries = get_cached_deliveries()
+        if cached_deliveries is not None:
+            _store_fetched_deliveries(cached_deliveries)
+            return True
+
+        future = start_background_deliveries_fetch()
+        if future is None:
+            # No access token - error already recorded by the client
+            _store_fetched_deliveries([])
+            return True
+        st.session_state.deliveries_future = future
+
+    if not future.done():
+        return False
+
+    del st.session_state.deliveries_future
+    _store_fetched_deliveries(finish_background_deliveries_fetch(future))
+    return True
+
+
+def _request_refresh():
+    """Callback for the Refresh button: drop loaded data so the next run refetches it.
+
+    Runs before the rerun the click triggers, so the dashboard reloads in a single
+    pass with no extra st.rerun(). Must be called via on_click.
+    """
+    # Clear session state and set flag to bypass Supabase cache
+    st.session_state.pop("leads", None)
+    st.session_state.pop("deliveries", None)
+    # Drop any initial-load fetches still in flight; the refresh fetches anew
+    st.session_state.pop("leads_future", None)
+    st.session_state.pop("deliveries_future", None)
+    st.session_state.refreshing = True
+    st.session_state.bypass_cache = True
+
+    # Clear notes and deliveries cache so fresh data is fetched
+    clear_notes_cache()
+    clear_deliveries_cache()
+
+    # Clear stage history and notes from session state (will be re-fetched)
+    # Also clear the session-level cache dicts
+    keys_to_clear = [k for k in st.session_state.keys()
+                     if k.startswith("stage_history_") or k.startswith("notes_")]
+    for key in keys_to_clear:
+        st.session_state.pop(key, None)
+    st.session_state.pop("stage_histories_session", None)
+
+    # Clear display data cache (will be rebuilt with fresh data)
+    st.session_state.pop("_display_cache_key", None)
+    st.session_state.pop("_display_data", None)
+
+
 def display_header():
     """Display header with last updated timestamp and refresh button."""
     col1, col2 = st.columns([4, 1])
@@ -247,32 +474,14 @@ def display_header():
 
     with col2:
         is_refreshing = st.session_state.get("refreshing", False)
-        if st.button("🔄 Refresh", disabled=is_refreshing, use_container_width=True):
-            from src.cache import clear_notes_cache, clear_deliveries_cache
+        st.button("🔄 Refresh", disabled=is_refreshing, use_container_width=True,
+                  on_click=_request_refresh)
 
-            # Clear session state and set flag to bypass Supabase cache
-            st.session_state.pop("leads", None)
-            st.session_state.pop("deliveries", None)
-            st.session_state.refreshing = True
-            st.session_state.bypass_cache = True
 
-            # Clear notes and deliveries cache so fresh data is fetched
-            clear_notes_cache()
-            clear_deliveries_cache()
-
-            # Clear stage history and notes from session state (will be re-fetched)
-            # Also clear the session-level cache dicts
-            keys_to_clear = [k for k in st.session_state.keys()
-                             if k.startswith("stage_history_") or k.startswith("notes_")]
-            for key in keys_to_clear:
-                st.session_state.pop(key, None)
-            st.session_state.pop("stage_histories_session", None)
-
-            # Clear display data cache (will be rebuilt with fresh data)
-            st.session_state.pop("_display_cache_key", None)
-            st.session_state.pop("_display_data", None)
-
-            st.rerun()
+def _retry_after_error():
+    """Callback for the Retry button: clear the error and cached leads. Must be called via on_click."""
+    clear_error()
+    st.session_state.pop("leads", None)
 
 
 def display_error_with_retry():
@@ -290,11 +499,7 @@ def display_error_with_retry():
     if error_type == ERROR_TYPE_AUTH:
         st.info("Please refresh the page to reconnect.")
     else:
-        if st.button("Retry", type="primary"):
-            # Clear error state and cached data
-            clear_error()
-            st.session_state.pop("leads", None)
-            st.rerun()
+        st.button("Retry", type="primary", on_click=_retry_after_error)
 
 
 def display_partial_warning():
@@ -304,72 +509,168 @@ def display_partial_warning():
         st.warning(partial_error)
 
 
+# Filter and sort widget keys with their default values
+FILTER_DEFAULTS = {
+    "filter_stage": ALL_STAGES,
+    "filter_locator": ALL_LOCATORS,
+    "filter_date_range": DEFAULT_DATE_RANGE,
+    "filter_status": ALL_STATUSES,
+    "sort_option": DEFAULT_SORT,
+}
+
+
 def initialize_filter_and_sort_state():
     """Initialize filter and sort session state with defaults."""
     # Apply pending stage filter from chart clicks (must happen before widget instantiation)
     if "_pending_filter_stage" in st.session_state:
-        st.session_state.filter_stage = st.session_state._pending_filter_stage
-        del st.session_state._pending_filter_stage
+        st.session_state.filter_stage = st.session_state.pop("_pending_filter_stage")
 
-    if "filter_stage" not in st.session_state:
-        st.session_state.filter_stage = ALL_STAGES
-    if "filter_locator" not in st.session_state:
-        st.session_state.filter_locator = ALL_LOCATORS
-    if "filter_date_range" not in st.session_state:
-        st.session_state.filter_date_range = DEFAULT_DATE_RANGE
-    if "filter_status" not in st.session_state:
-        st.session_state.filter_status = ALL_STATUSES
-    if "sort_option" not in st.session_state:
-        st.session_state.sort_option = DEFAULT_SORT
+    for key, default in FILTER_DEFAULTS.items():
+        st.session_state.setdefault(key, default)
 
 
 def _reset_all_filters():
     """Callback to reset all filters to defaults. Must be called via on_click."""
-    st.session_state.filter_stage = ALL_STAGES
-    st.session_state.filter_locator = ALL_LOCATORS
-    st.session_state.filter_date_range = DEFAULT_DATE_RANGE
-    st.session_state.filter_status = ALL_STATUSES
-    st.session_state.sort_option = DEFAULT_SORT
+    st.session_state.update(FILTER_DEFAULTS)
     st.session_state.leads_page = 0  # Reset pagination
 
 
+def _filters_key() -> tuple:
+    """Fingerprint of the display data version plus active filter settings (no sort)."""
+    ss = st.session_state
+    return (
+        ss.get("_display_version", 0),
+        ss.filter_stage,
+        ss.filter_locator,
+        ss.filter_date_range,
+        ss.filter_status,
+    )
+
+
+def _current_filter_key() -> tuple:
+    """Fingerprint of the display data version plus active filter and sort settings."""
+    return _filters_key() + (st.session_state.sort_option,)
+
+
+def _filter_and_sort(display_data: list[dict]) -> list[dict]:
+    """Apply the active filters and sort option to the formatted leads.
+
+    The selected sort is computed once per data load over all leads, starting
+    from the formatted (appointment) order, and then filtered: every sort is a
+    stable key sort and filtering preserves order, so the result and its ties
+    match sorting the filtered list, and filter changes never re-sort.
+    """
+    ss = st.session_state
+    sort_option = ss.sort_option
+    ordered = _session_cached(
+        "sorted_leads",
+        (ss.get("_display_version", 0), sort_option),
+        lambda: sort_leads(display_data, sort_option),
+    )
+    return apply_filters(
+        ordered,
+        ss.filter_stage,
+        ss.filter_locator,
+        ss.filter_date_range,
+        ss.filter_status,
+    )
+
+
+def _unfiltered_aggregates(display_data: list[dict]) -> dict:
+    """Aggregates over all leads, computed once per data load.
+
+    Shared by the daily snapshot and by the filtered view whenever the
+    filters keep every lead, so sort changes don't recount.
+    """
+    return _session_cached(
+        "unfiltered_aggregates",
+        st.session_state.get("_display_version", 0),
+        lambda: compute_status_aggregates(display_data),
+    )
+
+
+def _compute_filtered_view(display_data: list[dict]) -> dict:
+    """Filter and sort the leads and derive everything the dashboard shows for them.
+
+    Returns:
+        Dict with the filtered leads ('leads'), their status/stage/locator
+        aggregates ('aggregates') and the leads grouped by status ('status_buckets')
+    """
+    ss = st.session_state
+    filtered_data = _filter_and_sort(display_data)
+
+    # Filters only remove leads, so an unchanged count means the same set of leads
+    if len(filtered_data) == len(display_data):
+        aggregates = _unfiltered_aggregates(display_data)
+    else:
+        # Counted in appointment order like the unfiltered aggregates, so stage and
+        # locator ties don't move with the sort option (and sort changes don't recount)
+        aggregates = _session_cached(
+            "filtered_aggregates",
+            _filters_key(),
+            lambda: compute_status_aggregates(apply_filters(
+                display_data,
+                ss.filter_stage,
+                ss.filter_locator,
+                ss.filter_date_range,
+                ss.filter_status,
+            )),
+        )
+
+    return {
+        "leads": filtered_data,
+        "aggregates": aggregates,
+        "status_buckets": bucket_leads_by_status(filtered_data),
+    }
+
+
 def display_filters(display_data: list[dict]):
     """Display filter controls in a collapsible section.
 
     Uses Gestalt principle of enclosure to group filter controls.
     Collapsed by default to prioritize metrics visibility.
+
+    Returns:
+        Filtered view from _compute_filtered_view(), reused across reruns
+        until the data or any filter/sort setting changes
     """
+    ss = st.session_state
     initialize_filter_and_sort_state()
 
-    # Get unique values for dropdowns
-    stages = [ALL_STAGES] + get_unique_stages(display_data)
-    locators = [ALL_LOCATORS] + get_unique_locators(display_data)
+    # Get unique values for dropdowns (only change when new data is loaded)
+    stages, locators = _session_cached(
+        "filter_options",
+        ss.get("_display_version", 0),
+        lambda: (
+            [ALL_STAGES] + get_unique_stages(display_data),
+            [ALL_LOCATORS] + get_unique_locators(display_data),
+        ),
+    )
 
     # Validate current filter values exist in options (data may have changed)
-    if st.session_state.filter_stage not in stages:
-        st.session_state.filter_stage = ALL_STAGES
-    if st.session_state.filter_locator not in locators:
-        st.session_state.filter_locator = ALL_LOCATORS
+    stage = ss.filter_stage
+    locator = ss.filter_locator
+    if stage not in stages:
+        stage = ss.filter_stage = ALL_STAGES
+    if locator not in locators:
+        locator = ss.filter_locator = ALL_LOCATORS
+    status_filter = ss.filter_status
 
     # Check if any filters or non-default sort are active
-    filters_active = (
-        st.session_state.filter_stage != ALL_STAGES
-        or st.session_state.filter_locator != ALL_LOCATORS
-        or st.session_state.filter_date_range != DEFAULT_DATE_RANGE
-        or st.session_state.filter_status != ALL_STATUSES
-        or st.session_state.sort_option != DEFAULT_SORT
+    filters_active = any(
+        ss[key] != default for key, default in FILTER_DEFAULTS.items()
     )
 
     # Create filter summary for collapsed state
     filter_label = "Filters & Sort"
     if filters_active:
         active_filters = []
-        if st.session_state.filter_stage != ALL_STAGES:
-            active_filters.append(f"Stage: {st.session_state.filter_stage[:15]}...")
-        if st.session_state.filter_locator != ALL_LOCATORS:
-            active_filters.append(f"Locator: {st.session_state.filter_locator[:10]}...")
-        if st.session_state.filter_status != ALL_STATUSES:
-            active_filters.append(st.session_state.filter_status)
+        if stage != ALL_STAGES:
+            active_filters.append(f"Stage: {stage[:15]}...")
+        if locator != ALL_LOCATORS:
+            active_filters.append(f"Locator: {locator[:10]}...")
+        if status_filter != ALL_STATUSES:
+            active_filters.append(status_filter)
         filter_label = f"Filters & Sort ({len(active_filters)} active)"
 
     with st.expander(filter_label, expanded=filters_active):
@@ -417,17 +718,11 @@ def display_filters(display_data: list[dict]):
                 on_click=_reset_all_filters,
             )
 
-    # Apply filters
-    filtered_data = apply_filters(
-        display_data,
-        st.session_state.filter_stage,
-        st.session_state.filter_locator,
-        st.session_state.filter_date_range,
-        st.session_state.filter_status,
+    # Apply filters and sort (cached until data or filter settings change)
+    return _session_cached(
+        "filtered_view", _current_filter_key(), lambda: _compute_filtered_view(display_data)
     )
 
-    return filtered_data
-
 
 def _render_metric_card(count: int, label: str, color: str, bg_color: str, text_color: str, is_grayed: bool):
     """Render a single metric card with consistent styling."""
@@ -457,15 +752,17 @@ METRIC_CARD_CONFIG = [
 ]
 
 
-def display_metrics_cards(display_data: list[dict]):
+def display_metrics_cards(counts: dict[str, int]):
     """Display summary metrics with visual hierarchy.
 
     Uses scale and contrast to emphasize the most critical metric (Stale).
     Applies Gestalt principle of similarity with consistent color coding.
     Grays out zero-value cards when a status filter is active.
+
+    Args:
+        counts: Status counts for the filtered leads (from compute_status_aggregates)
     """
-    counts = count_leads_by_status(display_data)
-    total = len(display_data)
+    total = sum(counts.values())
 
     # Check if status filter is active (for graying out zero cards)
     status_filter_active = st.session_state.get("filter_status", ALL_STATUSES) != ALL_STATUSES
@@ -515,15 +812,16 @@ def display_metrics_cards(display_data: list[dict]):
                 is_grayed = status_filter_active and count == 0
                 _render_metric_card(count, label, color, bg_color, text_color, is_grayed)
 
-        # Summary bar showing proportions (Gestalt: continuation)
+        # Summary bar showing proportions (Gestalt: continuation).
+        # Spacer, bar and total label go out as one element.
         if total > 0:
-            st.markdown("<div style='height: 0.5rem'></div>", unsafe_allow_html=True)
             stale_pct = (counts["stale"] / total) * 100
             at_risk_pct = (counts["at_risk"] / total) * 100
             needs_pct = (counts["needs_attention"] / total) * 100
             healthy_pct = (counts["healthy"] / total) * 100
 
             st.markdown(f"""
+                <div style="height: 0.5rem"></div>
                 <div style="display: flex; height: 8px; border-radius: 4px; overflow: hidden; margin-top: 0.5rem;">
                     <div style="width: {stale_pct}%; background: #dc3545;" title="Stale: {counts['stale']}"></div>
                     <div style="width: {at_risk_pct}%; background: #ffc107;" title="At Risk: {counts['at_risk']}"></div>
@@ -555,53 +853,73 @@ def _truncate_note(note: str, max_len: int = 50) -> str:
     return note[:max_len].rsplit(" ", 1)[0] + "..."
 
 
-def display_priority_list(display_data: list[dict], max_visible: int = 5):
-    """Display 'At Risk' leads priority list with in-place expansion.
+def _set_list_expanded(key: str, expanded: bool):
+    """Callback to expand or collapse a priority list. Must be called via on_click."""
+    st.session_state[key] = expanded
 
-    Shows top items by default with toggle button to show all.
-    Lead names are hyperlinks to cards, Zoho column links to CRM.
-    """
-    from src.data_processing import format_zoho_link
 
-    # Filter to at_risk leads only
-    at_risk_leads = [
-        lead for lead in display_data
-        if "at_risk" in (lead.get("Status") or "").lower()
-    ]
+# Priority list table markup; styled by table.priority-table in the page CSS
+_PRIORITY_TABLE_TEMPLATE = (
+    '<table class="priority-table"><thead><tr><th>Lead</th><th>Appt Date</th>'
+    '<th>{days_header}</th><th>Locator</th><th>Zoho</th></tr></thead><tbody>{rows}</tbody></table>'
+)
+_PRIORITY_ROW_TEMPLATE = (
+    '<tr><td><a href="#lead-{lead_id}">{lead_name}</a></td><td>{appt_date}</td>'
+    '<td>{days}</td><td>{locator}</td><td>{zoho_cell}</td></tr>'
+)
 
-    if not at_risk_leads:
-        return
 
-    # Build table data
-    table_data = []
-    for lead in at_risk_leads:
-        # Format appointment date as MM.DD.YYYY
-        appt_date = lead.get("Appointment Date", "—")
-        if appt_date and appt_date != "—":
-            try:
-                from datetime import datetime as dt
-                parsed = dt.strptime(appt_date, "%b %d, %Y")
-                appt_date_formatted = parsed.strftime("%m.%d.%Y")
-            except (ValueError, TypeError):
-                appt_date_formatted = appt_date
-        else:
-            appt_date_formatted = "—"
+def _build_alert_table_html(leads: list[dict], visible_count: int, days_header: str) -> str:
+    """Build the HTML table for a priority list.
+
+    Args:
+        leads: Leads in one status bucket, already sorted
+        visible_count: Number of leading rows to render
+        days_header: Header for the days column ("Days Until" / "Days Since")
 
-        lead_id = lead.get("id", "")
+    Returns:
+        Table markup with lead names linking to cards and IDs linking to Zoho
+    """
+    # Render as HTML table - lead names trigger navigation via form.
+    # Cell styling lives in the page CSS (table.priority-table), not on every cell.
+    # Only the visible rows are formatted; the collapsed view stops after visible_count.
+    # Row fields are display strings from format_leads_for_display, so escape them directly
+    escape = html_module.escape
+    html_rows = []
+    for lead in islice(leads, visible_count):
+        lead_id = escape(lead.get("id") or "")
         days = lead.get("Days")
-        # For at-risk (future appointments), show just the number (days until)
-        days_display = str(abs(days)) if days is not None else "—"
+        # zoho_link is precomputed per lead by format_leads_for_display (None without an id)
+        zoho_link = lead.get("zoho_link")
+        zoho_cell = f'<a href="{zoho_link}" target="_blank">{lead_id}</a>' if zoho_link else "—"
+        html_rows.append(_PRIORITY_ROW_TEMPLATE.format(
+            lead_id=lead_id,
+            lead_name=escape(lead.get("Lead Name", "Unknown")),
+            appt_date=escape(lead.get("appointment_date_numeric", "—")),
+            # Show just the number (days until or since the appointment)
+            days=abs(days) if days is not None else "—",
+            locator=escape(lead.get("Locator", "—")),
+            zoho_cell=zoho_cell,
+        ))
 
-        table_data.append({
-            "id": lead_id,
-            "Lead": lead.get("Lead Name", "Unknown"),
-            "Appt Date": appt_date_formatted,
-            "Days Until": days_display,
-            "Locator": lead.get("Locator", "—"),
-            "zoho_url": format_zoho_link(lead_id) if lead_id else "",
-        })
+    return _PRIORITY_TABLE_TEMPLATE.format(days_header=days_header, rows="".join(html_rows))
 
-    total_count = len(table_data)
+
+@st.fragment
+def display_priority_list(at_risk_leads: list[dict], max_visible: int = 5):
+    """Display 'At Risk' leads priority list with in-place expansion.
+
+    Shows top items by default with toggle button to show all.
+    Lead names are hyperlinks to cards, Zoho column links to CRM.
+    Runs as a fragment so Show all / Show less reruns just this list.
+
+    Args:
+        at_risk_leads: The at_risk bucket from bucket_leads_by_status()
+    """
+    if not at_risk_leads:
+        return
+
+    total_count = len(at_risk_leads)
 
     # Header with count and reason in parentheses
     st.markdown(f"""
@@ -615,52 +933,40 @@ def display_priority_list(display_data: list[dict], max_visible: int = 5):
     # Initialize expansion state
     if "at_risk_expanded" not in st.session_state:
         st.session_state.at_risk_expanded = False
-
-    # Determine which rows to show
-    visible_data = table_data if (total_count <= max_visible or st.session_state.at_risk_expanded) else table_data[:max_visible]
-
-    # Render as HTML table - lead names trigger navigation via form
-    html_rows = []
-    for row in visible_data:
-        lead_id = _escape_html(row["id"])
-        lead_name = _escape_html(row["Lead"])
-        appt_date = _escape_html(row["Appt Date"])
-        days = _escape_html(row["Days Until"])
-        locator = _escape_html(row["Locator"])
-        zoho_url = row.get("zoho_url", "")
-        zoho_cell = f'<a href="{zoho_url}" target="_blank" style="color: #1a73e8; text-decoration: none;">{lead_id}</a>' if zoho_url else "—"
-        lead_link = f'<a href="#lead-{lead_id}" style="color: #1a73e8; text-decoration: none;">{lead_name}</a>'
-        html_rows.append(f'<tr><td style="padding: 8px; border-bottom: 1px solid #eee; width: 35%;">{lead_link}</td><td style="padding: 8px; border-bottom: 1px solid #eee; width: 12%;">{appt_date}</td><td style="padding: 8px; border-bottom: 1px solid #eee; width: 10%;">{days}</td><td style="padding: 8px; border-bottom: 1px solid #eee; width: 18%;">{locator}</td><td style="padding: 8px; border-bottom: 1px solid #eee; width: 25%;">{zoho_cell}</td></tr>')
-
-    html_table = f'<table style="width: 100%; border-collapse: collapse; font-size: 0.9rem; table-layout: fixed;"><thead><tr style="background: #f8f9fa; text-align: left;"><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 35%;">Lead</th><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 12%;">Appt Date</th><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 10%;">Days Until</th><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 18%;">Locator</th><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 25%;">Zoho</th></tr></thead><tbody>{"".join(html_rows)}</tbody></table>'
+    expanded = st.session_state.at_risk_expanded
+
+    # Table markup is reused across reruns until the data, filters or expansion change
+    visible_count = total_count if expanded else max_visible
+    html_table = _session_cached(
+        "at_risk_table",
+        (_current_filter_key(), expanded),
+        lambda: _build_alert_table_html(at_risk_leads, visible_count, "Days Until"),
+    )
     st.markdown(html_table, unsafe_allow_html=True)
 
     # Show expand/collapse button if needed (using callbacks to avoid double reruns)
     if total_count > max_visible:
-        if st.session_state.at_risk_expanded:
+        if expanded:
             st.button("Show less", key="at_risk_collapse",
-                      on_click=lambda: st.session_state.update(at_risk_expanded=False))
+                      on_click=_set_list_expanded, args=("at_risk_expanded", False))
         else:
             st.caption(f"Showing {max_visible} of {total_count}")
             st.button(f"Show all {total_count}", key="at_risk_expand",
-                      on_click=lambda: st.session_state.update(at_risk_expanded=True))
+                      on_click=_set_list_expanded, args=("at_risk_expanded", True))
 
 
-def display_needs_attention_list(display_data: list[dict], max_visible: int = 5):
+@st.fragment
+def display_needs_attention_list(needs_attention_leads: list[dict], max_visible: int = 5):
     """Display 'Needs Attention' leads list with in-place expansion.
 
     Shows leads that need attention (e.g., Green - Approved By Locator
     with no update in 7+ days). Shows top N by default with toggle button.
     Lead names are hyperlinks to Zoho CRM. Notes are shown in expandable cards.
-    """
-    from src.data_processing import format_zoho_link
-
-    # Filter to needs_attention leads only
-    needs_attention_leads = [
-        lead for lead in display_data
-        if "needs_attention" in (lead.get("Status") or "").lower()
-    ]
+    Runs as a fragment so Show all / Show less reruns just this list.
 
+    Args:
+        needs_attention_leads: The needs_attention bucket from bucket_leads_by_status()
+    """
     if not needs_attention_leads:
         return
 
@@ -674,95 +980,45 @@ def display_needs_attention_list(display_data: list[dict], max_visible: int = 5)
         </div>
     """, unsafe_allow_html=True)
 
-    # Create table data
-    table_data = []
-    for lead in needs_attention_leads:
-        # Format appointment date as MM.DD.YYYY
-        appt_date = lead.get("Appointment Date", "—")
-        if appt_date and appt_date != "—":
-            try:
-                from datetime import datetime as dt
-                parsed = dt.strptime(appt_date, "%b %d, %Y")
-                appt_date_formatted = parsed.strftime("%m.%d.%Y")
-            except (ValueError, TypeError):
-                appt_date_formatted = appt_date
-        else:
-            appt_date_formatted = "—"
-
-        lead_id = lead.get("id", "")
-        days = lead.get("Days")
-        # For needs-attention (past appointments), show just the number (days since)
-        days_display = str(abs(days)) if days is not None else "—"
-
-        table_data.append({
-            "id": lead_id,
-            "Lead": lead.get("Lead Name", "Unknown"),
-            "Appt Date": appt_date_formatted,
-            "Days Since": days_display,
-            "Locator": lead.get("Locator", "—"),
-            "zoho_url": format_zoho_link(lead_id) if lead_id else "",
-        })
-
     # Initialize expansion state
     if "needs_attention_expanded" not in st.session_state:
         st.session_state.needs_attention_expanded = False
-
-    # Determine which rows to show
-    visible_data = table_data if (total_count <= max_visible or st.session_state.needs_attention_expanded) else table_data[:max_visible]
-
-    # Render as HTML table
-    html_rows = []
-    for row in visible_data:
-        lead_id = _escape_html(row["id"])
-        lead_name = _escape_html(row["Lead"])
-        appt_date = _escape_html(row["Appt Date"])
-        days = _escape_html(row["Days Since"])
-        locator = _escape_html(row["Locator"])
-        zoho_url = row.get("zoho_url", "")
-        zoho_cell = f'<a href="{zoho_url}" target="_blank" style="color: #1a73e8; text-decoration: none;">{lead_id}</a>' if zoho_url else "—"
-        lead_link = f'<a href="#lead-{lead_id}" style="color: #1a73e8; text-decoration: none;">{lead_name}</a>'
-        html_rows.append(f'<tr><td style="padding: 8px; border-bottom: 1px solid #eee; width: 35%;">{lead_link}</td><td style="padding: 8px; border-bottom: 1px solid #eee; width: 12%;">{appt_date}</td><td style="padding: 8px; border-bottom: 1px solid #eee; width: 10%;">{days}</td><td style="padding: 8px; border-bottom: 1px solid #eee; width: 18%;">{locator}</td><td style="padding: 8px; border-bottom: 1px solid #eee; width: 25%;">{zoho_cell}</td></tr>')
-
-    html_table = f'<table style="width: 100%; border-collapse: collapse; font-size: 0.9rem; table-layout: fixed;"><thead><tr style="background: #f8f9fa; text-align: left;"><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 35%;">Lead</th><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 12%;">Appt Date</th><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 10%;">Days Since</th><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 18%;">Locator</th><th style="padding: 8px; border-bottom: 2px solid #dee2e6; width: 25%;">Zoho</th></tr></thead><tbody>{"".join(html_rows)}</tbody></table>'
+    expanded = st.session_state.needs_attention_expanded
+
+    # Table markup is reused across reruns until the data, filters or expansion change
+    visible_count = total_count if expanded else max_visible
+    html_table = _session_cached(
+        "needs_attention_table",
+        (_current_filter_key(), expanded),
+        lambda: _build_alert_table_html(needs_attention_leads, visible_count, "Days Since"),
+    )
     st.markdown(html_table, unsafe_allow_html=True)
 
     # Show expand/collapse button if needed (using callbacks to avoid double reruns)
     if total_count > max_visible:
-        if st.session_state.needs_attention_expanded:
+        if expanded:
             st.button("Show less", key="needs_attention_collapse",
-                      on_click=lambda: st.session_state.update(needs_attention_expanded=False))
+                      on_click=_set_list_expanded, args=("needs_attention_expanded", False))
         else:
             st.caption(f"Showing {max_visible} of {total_count}")
             st.button(f"Show all {total_count}", key="needs_attention_expand",
-                      on_click=lambda: st.session_state.update(needs_attention_expanded=True))
-
+                      on_click=_set_list_expanded, args=("needs_attention_expanded", True))
 
-def display_stage_pipeline(display_data: list[dict]):
-    """Display horizontal bar chart showing lead counts by stage.
 
-    Visualizes the pipeline to identify where leads are getting stuck.
-    Bars are color-coded by status breakdown within each stage.
-    Click on a stage bar to filter the dashboard to that stage.
-    """
-    stage_data = count_leads_by_stage(display_data)
-
-    if not stage_data:
-        st.info("No stage data available")
-        return
-
-    # Sort by total count descending for better visualization
-    stages = [d["stage"] for d in stage_data]
+def _build_stage_pipeline_figure(stage_data: dict[str, list]) -> go.Figure:
+    """Build the stacked stage pipeline bar chart."""
+    # Rows are already sorted by total count descending
+    stages = stage_data["stage"]
 
     # Build stacked horizontal bar chart with Plotly
     fig = go.Figure()
 
     # Use centralized status configuration
     for status_key, status_label, color in get_status_chart_config():
-        values = [d[status_key] for d in stage_data]
         fig.add_trace(go.Bar(
             name=status_label,
             y=stages,
-            x=values,
+            x=stage_data[status_key],
             orientation="h",
             marker_color=color,
             customdata=stages,
@@ -785,6 +1041,27 @@ def display_stage_pipeline(display_data: list[dict]):
         margin=dict(t=40, b=60, l=10, r=20),
         height=max(300, len(stages) * 25 + 100),
     )
+    return fig
+
+
+def display_stage_pipeline(stage_data: dict[str, list]):
+    """Display horizontal bar chart showing lead counts by stage.
+
+    Visualizes the pipeline to identify where leads are getting stuck.
+    Bars are color-coded by status breakdown within each stage.
+    Click on a stage bar to filter the dashboard to that stage.
+
+    Args:
+        stage_data: Stage columns for the filtered leads (from compute_status_aggregates)
+    """
+    if not stage_data["stage"]:
+        st.info("No stage data available")
+        return
+
+    # Figure is reused across reruns until the data or filters change
+    fig = _session_cached(
+        "stage_pipeline_fig", _summary_key(stage_data), lambda: _build_stage_pipeline_figure(stage_data)
+    )
 
     # Enable click-to-filter with on_select
     event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", key="stage_pipeline_chart")
@@ -802,56 +1079,71 @@ def display_stage_pipeline(display_data: list[dict]):
             # No st.rerun() needed - on_select="rerun" handles it
 
 
-def display_locator_workload(display_data: list[dict]):
+# Display labels and widths for the locator workload table, keyed by field name
+WORKLOAD_COLUMN_CONFIG = {
+    "locator": st.column_config.TextColumn("Locator", width="medium"),
+    "total": st.column_config.NumberColumn("Total", width="small"),
+    "stale": st.column_config.NumberColumn("🔴 Stale", width="small"),
+    "at_risk": st.column_config.NumberColumn("🟡 At Risk", width="small"),
+    "needs_attention": st.column_config.NumberColumn("🟠 Needs Attn", width="small"),
+    "healthy": st.column_config.NumberColumn("🟢 Healthy", width="small"),
+}
+
+# Arrow types for the workload columns, so building the table skips type inference
+WORKLOAD_TABLE_SCHEMA = pa.schema(
+    [("locator", pa.string())]
+    + [(field, pa.int32()) for field in ("total", "stale", "at_risk", "needs_attention", "healthy")]
+)
+
+
+def _build_workload_table(workload_data: dict[str, list]) -> pa.Table | None:
+    """Build the locator workload table.
+
+    st.dataframe renders Arrow tables directly, so building one from the
+    workload columns with a fixed schema skips the intermediate pandas
+    DataFrame and dtype inference. Columns keep their field names;
+    WORKLOAD_COLUMN_CONFIG supplies the display labels.
+
+    Returns:
+        Arrow table, or None if there is no locator data
+    """
+    if not workload_data["locator"]:
+        return None
+
+    return pa.Table.from_pydict(workload_data, schema=WORKLOAD_TABLE_SCHEMA)
+
+
+def display_locator_workload(workload_data: dict[str, list]):
     """Display locator workload table with status breakdown.
 
     Shows which locators have the most urgent leads needing attention.
     Sorted by urgency (stale + at_risk + needs_attention).
+
+    Args:
+        workload_data: Locator columns for the filtered leads (from compute_status_aggregates)
     """
-    workload_data = get_locator_workload(display_data)
+    # Table is reused across reruns until the data or filters change
+    workload_table = _session_cached(
+        "workload_table", _summary_key(workload_data), lambda: _build_workload_table(workload_data)
+    )
 
-    if not workload_data:
+    if workload_table is None:
         st.info("No locator data available")
         return
 
     st.markdown("### Locator Workload")
 
-    # Create DataFrame for display
-    df = pd.DataFrame(workload_data)
-
-    # Rename columns for display
-    df = df.rename(columns={
-        "locator": "Locator",
-        "total": "Total",
-        "stale": "🔴 Stale",
-        "at_risk": "🟡 At Risk",
-        "needs_attention": "🟠 Needs Attn",
-        "healthy": "🟢 Healthy",
-    })
-
     # Display as styled dataframe
     st.dataframe(
-        df,
+        workload_table,
         hide_index=True,
         use_container_width=True,
-        column_config={
-            "Locator": st.column_config.TextColumn("Locator", width="medium"),
-            "Total": st.column_config.NumberColumn("Total", width="small"),
-            "🔴 Stale": st.column_config.NumberColumn("🔴 Stale", width="small"),
-            "🟡 At Risk": st.column_config.NumberColumn("🟡 At Risk", width="small"),
-            "🟠 Needs Attn": st.column_config.NumberColumn("🟠 Needs Attn", width="small"),
-            "🟢 Healthy": st.column_config.NumberColumn("🟢 Healthy", width="small"),
-        },
+        column_config=WORKLOAD_COLUMN_CONFIG,
     )
 
 
-def display_status_donut(display_data: list[dict]):
-    """Display donut chart showing status distribution.
-
-    Provides a visual breakdown of lead health across the pipeline.
-    """
-    counts = count_leads_by_status(display_data)
-
+def _build_status_donut_figure(counts: dict[str, int]) -> go.Figure | None:
+    """Build the status distribution donut, or None if every count is zero."""
     # Prepare data for donut chart
     labels = ["Stale", "At Risk", "Needs Attention", "Healthy"]
     values = [counts["stale"], counts["at_risk"], counts["needs_attention"], counts["healthy"]]
@@ -861,8 +1153,7 @@ def display_status_donut(display_data: list[dict]):
     filtered_data = [(l, v, c) for l, v, c in zip(labels, values, colors) if v > 0]
 
     if not filtered_data:
-        st.info("No status data available")
-        return
+        return None
 
     labels, values, colors = zip(*filtered_data)
 
@@ -883,83 +1174,85 @@ def display_status_donut(display_data: list[dict]):
         margin=dict(t=40, b=40, l=20, r=20),
         height=350,
     )
-
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
-def display_appointments_timeline(display_data: list[dict]):
-    """Display bar chart showing appointment volume by week, color-coded by status.
+def display_status_donut(counts: dict[str, int]):
+    """Display donut chart showing status distribution.
 
-    Helps identify trends and busy periods in the appointment pipeline.
+    Provides a visual breakdown of lead health across the pipeline.
 
     Args:
-        display_data: List of formatted lead dictionaries
+        counts: Status counts for the filtered leads (from compute_status_aggregates)
     """
-    from collections import defaultdict
-    from datetime import datetime, timedelta
-
-    if not display_data:
-        st.info("No appointment data available")
+    fig = _session_cached(
+        "status_donut_fig", _summary_key(counts), lambda: _build_status_donut_figure(counts)
+    )
+    if fig is None:
+        st.info("No status data available")
         return
 
-    # Group appointments by week and status
-    week_status_counts = defaultdict(lambda: {"stale": 0, "at_risk": 0, "needs_attention": 0, "healthy": 0})
+    st.plotly_chart(fig, use_container_width=True)
 
-    for lead in display_data:
-        days = lead.get("Days")
-        if days is None:
-            continue
 
-        # Calculate the appointment date from days since
-        today = datetime.now(timezone.utc).date()
-        appt_date = today - timedelta(days=days)
-
-        # Get the Monday of that week (week start)
-        week_start = appt_date - timedelta(days=appt_date.weekday())
-        week_key = week_start.strftime("%Y-%m-%d")
-
-        # Get status
-        status = lead.get("Status") or ""
-        if "stale" in status.lower():
-            week_status_counts[week_key]["stale"] += 1
-        elif "at_risk" in status.lower():
-            week_status_counts[week_key]["at_risk"] += 1
-        elif "needs_attention" in status.lower():
-            week_status_counts[week_key]["needs_attention"] += 1
-        else:
-            week_status_counts[week_key]["healthy"] += 1
+# Beyond this many weeks the appointments timeline is binned by month instead
+TIMELINE_MAX_WEEKS = 52
 
-    if not week_status_counts:
-        st.info("No appointment data to display")
-        return
+# Unpadded day-of-month label (e.g., "Jan 6"); Windows strftime uses "#" instead of "-"
+_MONTH_DAY_FMT = "%b %#d" if platform.system() == "Windows" else "%b %-d"
 
-    # Sort by week and prepare data for chart
-    sorted_weeks = sorted(week_status_counts.keys())
 
-    # Format week labels nicely (e.g., "Jan 6")
-    week_labels = []
-    for week in sorted_weeks:
-        dt = datetime.strptime(week, "%Y-%m-%d")
-        week_labels.append(dt.strftime("%b %-d") if platform.system() != "Windows" else dt.strftime("%b %#d"))
+def _build_appointments_timeline_figure(appointment_days: dict[str, list], today: date) -> go.Figure | None:
+    """Build the appointments stacked bar chart, or None if no lead has a date.
 
-    # Build traces for stacked bar chart
-    fig = go.Figure()
+    Appointments are grouped by week, or by month when they span more than
+    TIMELINE_MAX_WEEKS weeks, to keep the bar count bounded.
+    """
+    if not appointment_days["days"]:
+        return None
+
+    # Group appointments by week and status in one vectorized pass
+    days = pd.Series(appointment_days["days"])
+    statuses = pd.Series(appointment_days["status_key"])
+
+    # Calculate the appointment date from days since, then the Monday of that week
+    appt_dates = pd.Timestamp(today) - pd.to_timedelta(days, unit="D")
+    period_starts = (appt_dates - pd.to_timedelta(appt_dates.dt.weekday, unit="D")).dt.normalize()
+
+    # Format labels nicely (e.g., "Jan 6" for weeks, "Jan 2025" for months)
+    label_format = _MONTH_DAY_FMT
+    period_name = "Week"
+    # Calendar span from the first to the last week, counting weeks without appointments
+    span_weeks = (period_starts.max() - period_starts.min()).days // 7 + 1
+    if span_weeks > TIMELINE_MAX_WEEKS:
+        period_starts = appt_dates.dt.to_period("M").dt.start_time
+        label_format = "%b %Y"
+        period_name = "Month"
 
     # Add bars in order: healthy (bottom), needs_attention, at_risk, stale (top)
     # Reverse the standard config order for bottom-up stacking
     status_configs = get_status_chart_config()[::-1]
 
+    # Rows are periods in ascending order, columns are status keys
+    period_status_counts = pd.crosstab(period_starts, statuses).reindex(
+        columns=[status_key for status_key, _, _ in status_configs], fill_value=0
+    )
+    period_labels = period_status_counts.index.strftime(label_format).tolist()
+
+    # Build traces for stacked bar chart
+    fig = go.Figure()
+
     for status_key, status_label, color in status_configs:
-        values = [week_status_counts[week][status_key] for week in sorted_weeks]
+        values = period_status_counts[status_key].tolist()
         fig.add_trace(go.Bar(
             name=status_label,
-            x=week_labels,
+            x=period_labels,
             y=values,
             marker_color=color,
         ))
 
     fig.update_layout(
-        title_text="Appointments by Week",
+        title_text=f"Appointments by {period_name}",
         barmode="stack",
         xaxis_title="",
         yaxis_title="Appointments",
@@ -974,37 +1267,36 @@ def display_appointments_timeline(display_data: list[dict]):
         margin=dict(t=40, b=80, l=40, r=20),
         height=380,
     )
-
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
-def display_status_trend(display_data: list[dict]):
-    """Display line chart showing health rate percentage over time.
+def display_appointments_timeline(appointment_days: dict[str, list], today: date):
+    """Display bar chart showing appointment volume by week, color-coded by status.
 
-    Shows a single line tracking the percentage of leads that are healthy,
-    making it easy to see if things are improving or getting worse.
+    Helps identify trends and busy periods in the appointment pipeline.
 
     Args:
-        display_data: List of formatted lead dictionaries
+        appointment_days: Days/status columns for the filtered leads (from compute_status_aggregates)
+        today: Current UTC date, used to turn days-since into appointment weeks
     """
-    # Create a stable cache key using sorted IDs (order-independent)
-    lead_ids = sorted(lead.get("id", "") for lead in display_data if lead.get("id"))
-    # Use hash of sample IDs for stable key regardless of data order
-    ids_hash = hash("".join(lead_ids[:10] + lead_ids[-10:])) if lead_ids else 0
-    cache_key = f"trend_{len(display_data)}_{ids_hash}"
-
-    # Check session state cache first
-    if "trend_cache_key" in st.session_state and st.session_state.trend_cache_key == cache_key:
-        trend_data = st.session_state.trend_data
-    else:
-        # Calculate and cache
-        trend_data = calculate_historical_status_trend(display_data, weeks=13)
-        st.session_state.trend_cache_key = cache_key
-        st.session_state.trend_data = trend_data
+    # Week buckets are relative to today, so the date is part of the key. The
+    # timeline depends on the filtered set only, so sort changes reuse the figure.
+    fig = _session_cached(
+        "timeline_fig",
+        (_filters_key(), today),
+        lambda: _build_appointments_timeline_figure(appointment_days, today),
+    )
+    if fig is None:
+        st.info("No appointment data to display")
+        return
+
+    st.plotly_chart(fig, use_container_width=True)
 
+
+def _build_status_trend_figure(trend_data: list[dict]) -> go.Figure | None:
+    """Build the health rate line chart, or None with fewer than two data points."""
     if len(trend_data) < 2:
-        st.info("Not enough data for trend chart.")
-        return
+        return None
 
     # Calculate health rate % for each week
     dates = [d["date_label"] for d in trend_data]
@@ -1054,23 +1346,35 @@ def display_status_trend(display_data: list[dict]):
         hovermode="x unified",
         showlegend=False,
     )
+    return fig
 
-    st.plotly_chart(fig, use_container_width=True)
 
+def display_status_trend(display_data: list[dict], today: date):
+    """Display line chart showing health rate percentage over time.
 
-def display_conversion_funnel(display_data: list[dict]):
-    """Display conversion funnel showing lead progression through pipeline.
+    Shows a single line tracking the percentage of leads that are healthy,
+    making it easy to see if things are improving or getting worse.
 
-    Shows how leads progress from appointment → acknowledged → approved → closed.
+    Args:
+        display_data: List of formatted lead dictionaries
+        today: Current UTC date (weekly samples count back from it, so the cache is keyed on it)
     """
-    funnel_data = get_conversion_funnel(display_data)
+    # Trend uses unfiltered data, so it only changes when the data is rebuilt or the day rolls over
+    cache_key = (st.session_state.get("_display_version", 0), today)
 
-    if not funnel_data:
-        st.info("No data for conversion funnel")
+    trend_data = _session_cached(
+        "trend", cache_key, lambda: calculate_historical_status_trend(display_data, weeks=13)
+    )
+    fig = _session_cached("trend_fig", cache_key, lambda: _build_status_trend_figure(trend_data))
+    if fig is None:
+        st.info("Not enough data for trend chart.")
         return
 
-    st.markdown("### Conversion Funnel")
+    st.plotly_chart(fig, use_container_width=True)
+
 
+def _build_conversion_funnel_figure(funnel_data: list[dict]) -> go.Figure:
+    """Build the conversion funnel chart."""
     # Build funnel chart with Plotly
     stages = [d["stage"] for d in funnel_data]
     counts = [d["count"] for d in funnel_data]
@@ -1100,11 +1404,69 @@ def display_conversion_funnel(display_data: list[dict]):
         height=250,
         funnelmode="stack",
     )
+    return fig
 
+
+def display_conversion_funnel(display_data: list[dict]):
+    """Display conversion funnel showing lead progression through pipeline.
+
+    Shows how leads progress from appointment → acknowledged → approved → closed.
+    """
+    funnel_data = _session_cached(
+        "funnel", _current_filter_key(), lambda: get_conversion_funnel(display_data)
+    )
+
+    if not funnel_data:
+        st.info("No data for conversion funnel")
+        return
+
+    st.markdown("### Conversion Funnel")
+
+    funnel_key = tuple(tuple(d.values()) for d in funnel_data)
+    fig = _session_cached("funnel_fig", funnel_key, lambda: _build_conversion_funnel_figure(funnel_data))
     st.plotly_chart(fig, use_container_width=True)
 
 
-def display_closing_ratio(filtered_data: list[dict], all_data: list[dict]):
+def _build_closing_ratio_figure(months_with_data: list[dict], avg_ratio: float | None) -> go.Figure:
+    """Build the monthly closing ratio bar chart with an average reference line."""
+    # Build bar chart showing closing ratio by month
+    fig = go.Figure()
+
+    # Add bars for closing ratio
+    fig.add_trace(go.Bar(
+        name="Closing Ratio",
+        x=[m["month_label"] for m in months_with_data],
+        y=[m["ratio"] for m in months_with_data],
+        marker_color="#1a73e8",
+        text=[f"{m['ratio']:.0f}%" for m in months_with_data],
+        textposition="outside",
+        hovertemplate="<b>%{x}</b><br>Ratio: %{y:.1f}%<br>Completed: %{customdata}<extra></extra>",
+        customdata=[m["total_completed"] for m in months_with_data],
+    ))
+
+    # Add a reference line at overall average
+    if avg_ratio is not None:
+        fig.add_hline(
+            y=avg_ratio,
+            line_dash="dash",
+            line_color="#888",
+            annotation_text=f"Avg: {avg_ratio:.0f}%",
+            annotation_position="right",
+        )
+
+    fig.update_layout(
+        title_text="Monthly Closing Ratio Trend",
+        xaxis_title="",
+        yaxis_title="Closing Ratio (%)",
+        yaxis=dict(range=[0, 105]),  # 0-100% with room for labels
+        showlegend=False,
+        margin=dict(t=40, b=40, l=40, r=60),
+        height=300,
+    )
+    return fig
+
+
+def display_closing_ratio(filtered_data: list[dict], all_data: list[dict], today: date):
     """Display closing ratio summary metric and monthly trend chart.
 
     Shows:
@@ -1114,6 +1476,7 @@ def display_closing_ratio(filtered_data: list[dict], all_data: list[dict]):
     Args:
         filtered_data: Filtered leads list (for summary metric)
         all_data: Unfiltered leads list (for trend chart - always shows 6 months)
+        today: Current UTC date (the monthly cache is keyed on it)
     """
     # Header with tooltip using expander for explanation
     col_title, col_help = st.columns([6, 1])
@@ -1141,10 +1504,16 @@ def display_closing_ratio(filtered_data: list[dict], all_data: list[dict]):
             """)
 
     # Calculate summary from filtered data
-    summary = get_closing_ratio_summary(filtered_data)
+    summary = _session_cached(
+        "closing_summary", _current_filter_key(), lambda: get_closing_ratio_summary(filtered_data)
+    )
 
-    # Calculate monthly data from ALL data (always show 6 months history)
-    monthly_data = get_closing_ratio_by_month(all_data, months=6)
+    # Calculate monthly data from ALL data (always show 6 months history).
+    # Month windows are relative to today, so the date is part of the key.
+    monthly_key = (st.session_state.get("_display_version", 0), today)
+    monthly_data = _session_cached(
+        "closing_monthly", monthly_key, lambda: get_closing_ratio_by_month(all_data, months=6)
+    )
 
     # Layout: Summary metric on left, trend chart on right
     metric_col, chart_col = st.columns([1, 2])
@@ -1214,41 +1583,11 @@ def display_closing_ratio(filtered_data: list[dict], all_data: list[dict]):
             st.info("Trend data will appear after more leads reach terminal stages")
             return
 
-        # Build bar chart showing closing ratio by month
-        fig = go.Figure()
-
-        # Add bars for closing ratio
-        fig.add_trace(go.Bar(
-            name="Closing Ratio",
-            x=[m["month_label"] for m in months_with_data],
-            y=[m["ratio"] for m in months_with_data],
-            marker_color="#1a73e8",
-            text=[f"{m['ratio']:.0f}%" for m in months_with_data],
-            textposition="outside",
-            hovertemplate="<b>%{x}</b><br>Ratio: %{y:.1f}%<br>Completed: %{customdata}<extra></extra>",
-            customdata=[m["total_completed"] for m in months_with_data],
-        ))
-
-        # Add a reference line at overall average
-        if summary["ratio"] is not None:
-            fig.add_hline(
-                y=summary["ratio"],
-                line_dash="dash",
-                line_color="#888",
-                annotation_text=f"Avg: {summary['ratio']:.0f}%",
-                annotation_position="right",
-            )
-
-        fig.update_layout(
-            title_text="Monthly Closing Ratio Trend",
-            xaxis_title="",
-            yaxis_title="Closing Ratio (%)",
-            yaxis=dict(range=[0, 105]),  # 0-100% with room for labels
-            showlegend=False,
-            margin=dict(t=40, b=40, l=40, r=60),
-            height=300,
+        fig = _session_cached(
+            "closing_fig",
+            (monthly_key, summary["ratio"]),
+            lambda: _build_closing_ratio_figure(months_with_data, summary["ratio"]),
         )
-
         st.plotly_chart(fig, use_container_width=True)
 
 
@@ -1265,14 +1604,12 @@ def display_lead_detail(lead: dict):
     Args:
         lead: Formatted lead dictionary from format_leads_for_display()
     """
+    # Each section's lines are joined into one markdown element instead of one per line
+
     # Lead name header with Zoho link
     lead_name = lead.get("Lead Name", "Unknown")
     zoho_link = lead.get("zoho_link")
-
-    if zoho_link:
-        st.markdown(f"## {lead_name} [↗]({zoho_link})")
-    else:
-        st.markdown(f"## {lead_name}")
+    header_lines = [f"## {lead_name} [↗]({zoho_link})" if zoho_link else f"## {lead_name}"]
 
     # Current stage section - prominently displayed
     stage = lead.get("Stage", "—")
@@ -1281,10 +1618,11 @@ def display_lead_detail(lead: dict):
     time_in_stage = format_time_in_stage(days)
 
     # Stage with visual emphasis
-    st.markdown(f"### Current Stage: {stage}")
+    header_lines.append(f"### Current Stage: {stage}")
     if status:
-        st.markdown(f"**Status:** {status}")
-    st.markdown(f"**In this stage for:** {time_in_stage}")
+        header_lines.append(f"**Status:** {status}")
+    header_lines.append(f"**In this stage for:** {time_in_stage}")
+    st.markdown("\n\n".join(header_lines))
 
     st.divider()
 
@@ -1292,30 +1630,30 @@ def display_lead_detail(lead: dict):
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown("**Appointment Details**")
-        st.write(f"📅 Date: {lead.get('Appointment Date', '—')}")
+        appointment_lines = ["**Appointment Details**", f"📅 Date: {lead.get('Appointment Date', '—')}"]
         if days is not None:
             if days < 0:
-                st.write(f"📊 Days until: {abs(days)}")
+                appointment_lines.append(f"📊 Days until: {abs(days)}")
             else:
-                st.write(f"📊 Days since: {days}")
+                appointment_lines.append(f"📊 Days since: {days}")
+        st.markdown("\n\n".join(appointment_lines))
 
     with col2:
-        st.markdown("**Locator Contact**")
         locator = lead.get("Locator", "—")
-        st.write(f"👤 {locator}")
+        contact_lines = ["**Locator Contact**", f"👤 {locator}"]
 
         # Contact links
         phone = lead.get("Phone")
         email = lead.get("Email")
 
         if phone:
-            st.markdown(f"📞 [{phone.replace('tel:', '')}]({phone})")
+            contact_lines.append(f"📞 [{phone.replace('tel:', '')}]({phone})")
         if email:
-            st.markdown(f"✉️ [{email.replace('mailto:', '')}]({email})")
+            contact_lines.append(f"✉️ [{email.replace('mailto:', '')}]({email})")
 
         if not phone and not email:
-            st.write("No contact info available")
+            contact_lines.append("No contact info available")
+        st.markdown("\n\n".join(contact_lines))
 
     # Notes section - use prefetched notes from session state, fall back to misc notes fields
     st.divider()
@@ -1346,95 +1684,46 @@ def display_lead_detail(lead: dict):
             note_source = "misc"
 
     # Display the note
+    note_heading = "**Latest Note**"
     if note_time:
-        from src.zoho_client import parse_zoho_date
         parsed_time = parse_zoho_date(note_time) if isinstance(note_time, str) else note_time
         if parsed_time:
             time_str = parsed_time.strftime("%b %d, %Y at %I:%M %p")
-            st.markdown(f"**Latest Note** ({time_str})")
-        else:
-            st.markdown("**Latest Note**")
+            note_heading = f"**Latest Note** ({time_str})"
     elif note_source in ("misc_long", "misc"):
-        st.markdown("**Latest Note** (from Misc Notes)")
-    else:
-        st.markdown("**Latest Note**")
+        note_heading = "**Latest Note** (from Misc Notes)"
 
-    if note_content:
-        st.write(note_content)
-    else:
-        st.write("No notes available")
+    st.markdown(f"{note_heading}\n\n{note_content or 'No notes available'}")
 
     # Classification Reason section
     classification_reason = lead.get("classification_reason")
     if classification_reason:
         st.divider()
-        st.markdown("**Classification Reason**")
         # Use markdown to render links in the reason
-        st.markdown(f"> {classification_reason}")
+        st.markdown(f"**Classification Reason**\n\n> {classification_reason}")
 
     # Stage History section (Story 4.2)
     st.divider()
     display_stage_history(lead)
 
-    # Back to top button
-    col1, col2, col3 = st.columns([2, 1, 1])
-    with col3:
-        if st.button("↑ Back to top", key=f"back_top_{lead.get('id', '')}", use_container_width=True):
-            st.session_state.scroll_to_top = True
-            st.rerun()
-
+    # Back to top button (keyed by lead ID, so leads without one go without)
+    if lead_id:
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col3:
+            if st.button("↑ Back to top", key=f"back_top_{lead_id}", use_container_width=True):
+                st.session_state.scroll_to_top = True
+                st.rerun()
 
-def display_stage_history(lead: dict):
-    """Display stage transition history for a lead (Story 4.2).
 
-    Fetches and displays the chronological stage history with timestamps.
-    Handles empty history and pipeline completion status.
-    Includes smart cache invalidation and manual refresh button.
+def _build_stage_history_html(history: list[dict]) -> str:
+    """Build the vertical timeline markup for a formatted stage history.
 
     Args:
-        lead: Formatted lead dictionary with 'id' and 'Stage' fields
-    """
-    from src.cache import clear_cache
+        history: Transitions from format_stage_history()
 
-    lead_id = lead.get("id")
-    if not lead_id:
-        st.markdown("### Stage History")
-        st.write("Stage history not available (no lead ID)")
-        return
-
-    current_stage = lead.get("Stage")
-
-    # Session state keys
-    cache_key = f"stage_history_{lead_id}"
-    error_key = f"stage_history_error_{lead_id}"
-
-    st.markdown("### Stage History")
-
-    # Fetch stage history (cached per lead in session state)
-    if cache_key not in st.session_state:
-        with st.spinner("Loading stage history..."):
-            # Pass current_stage for smart cache invalidation
-            raw_history = get_stage_history(lead_id, current_stage=current_stage)
-            if raw_history is None:
-                # API error - mark as error, don't cache empty list
-                st.session_state[error_key] = True
-                st.session_state[cache_key] = []
-            else:
-                st.session_state[error_key] = False
-                st.session_state[cache_key] = format_stage_history(raw_history)
-
-    # Check if there was an API error
-    if st.session_state.get(error_key, False):
-        st.warning("Unable to load stage history")
-        return
-
-    history = st.session_state[cache_key]
-
-    if not history:
-        st.info("No stage changes recorded yet. The lead may be new or still in its initial stage.")
-        return
-
-    # Build vertical timeline HTML
+    Returns:
+        Timeline HTML with escaped transition and timestamp text
+    """
     timeline_items = []
     for i, item in enumerate(history):
         transition = item["transition"]
@@ -1476,8 +1765,66 @@ def display_stage_history(lead: dict):
             f'</div>'
         )
 
-    timeline_html = f'<div style="padding:10px 0;">{"".join(timeline_items)}</div>'
-    st.markdown(timeline_html, unsafe_allow_html=True)
+    return f'<div style="padding:10px 0;">{"".join(timeline_items)}</div>'
+
+
+def display_stage_history(lead: dict):
+    """Display stage transition history for a lead (Story 4.2).
+
+    Fetches and displays the chronological stage history with timestamps.
+    Handles empty history and pipeline completion status.
+    Passes the current stage for smart cache invalidation; the header Refresh
+    button clears the history and its cached timeline markup.
+
+    Args:
+        lead: Formatted lead dictionary with 'id' and 'Stage' fields
+    """
+    ss = st.session_state
+
+    lead_id = lead.get("id")
+    if not lead_id:
+        st.markdown("### Stage History")
+        st.write("Stage history not available (no lead ID)")
+        return
+
+    current_stage = lead.get("Stage")
+
+    # Session state keys
+    cache_key = f"stage_history_{lead_id}"
+    error_key = f"stage_history_error_{lead_id}"
+
+    st.markdown("### Stage History")
+
+    # Fetch stage history (cached per lead in session state)
+    if cache_key not in ss:
+        with st.spinner("Loading stage history..."):
+            # Pass current_stage for smart cache invalidation
+            raw_history = get_stage_history(lead_id, current_stage=current_stage)
+            if raw_history is None:
+                # API error - mark as error, don't cache empty list
+                ss[error_key] = True
+                ss[cache_key] = []
+            else:
+                ss[error_key] = False
+                ss[cache_key] = format_stage_history(raw_history)
+
+    # Check if there was an API error
+    if ss.get(error_key, False):
+        st.warning("Unable to load stage history")
+        return
+
+    history = ss[cache_key]
+
+    if not history:
+        st.info("No stage changes recorded yet. The lead may be new or still in its initial stage.")
+        return
+
+    # Build vertical timeline HTML once per lead; it is cleared together with the
+    # history itself (Refresh and stale-lead cleanup drop every stage_history_ key)
+    html_key = f"stage_history_html_{lead_id}"
+    if html_key not in ss:
+        ss[html_key] = _build_stage_history_html(history)
+    st.markdown(ss[html_key], unsafe_allow_html=True)
 
 
 def _prefetch_stage_histories(leads: list[dict]):
@@ -1492,8 +1839,6 @@ def _prefetch_stage_histories(leads: list[dict]):
     Args:
         leads: List of formatted lead dictionaries with 'id' and 'Stage' fields
     """
-    from src.zoho_client import get_stage_histories_batch
-
     # Get leads that don't already have stage history in session state
     leads_to_fetch = []
     for lead in leads:
@@ -1508,7 +1853,8 @@ def _prefetch_stage_histories(leads: list[dict]):
         return
 
     # Batch fetch: checks Supabase cache AND fetches uncached from API concurrently
-    histories = get_stage_histories_batch(leads_to_fetch)
+    failed_ids = set()
+    histories = get_stage_histories_batch(leads_to_fetch, failed_ids=failed_ids)
 
     # Store results in session state (both raw and formatted)
     for lead_id, history in histories.items():
@@ -1519,6 +1865,13 @@ def _prefetch_stage_histories(leads: list[dict]):
         # Store raw for v2 classification
         st.session_state[f"stage_history_raw_{lead_id}"] = history
 
+    # Leads whose API request failed are recorded as errors (cleared by Refresh) so
+    # display_stage_history() doesn't retry them one blocking request at a time.
+    # Leads never requested (e.g. no token) stay unset and are fetched on demand.
+    for lead_id in failed_ids:
+        st.session_state[f"stage_history_{lead_id}"] = []
+        st.session_state[f"stage_history_error_{lead_id}"] = True
+
 
 def get_raw_stage_histories(lead_ids: list[str]) -> dict[str, list]:
     """Get raw stage histories from session state.
@@ -1546,8 +1899,6 @@ def _prefetch_notes(leads: list[dict]):
     Stores results in session state for use by display_lead_detail.
     This avoids N+1 queries when rendering lead cards.
     """
-    from src.zoho_client import get_notes_for_leads
-
     # Get lead IDs that don't already have notes in session state
     lead_ids_to_fetch = []
     for lead in leads:
@@ -1583,8 +1934,10 @@ def _cleanup_stale_session_state(current_lead_ids: set[str]):
     prefixes = [
         "stage_history_error_",
         "stage_history_raw_",
+        "stage_history_html_",
         "stage_history_",
         "notes_",
+        "expanded_",
     ]
 
     # Find stale keys to remove
@@ -1602,72 +1955,174 @@ def _cleanup_stale_session_state(current_lead_ids: set[str]):
         del st.session_state[key]
 
 
+# Number of lead cards rendered per page (keeps widget count bounded)
+LEADS_PAGE_SIZE = 50
+
+# Card header fields, always set by format_leads_for_display()
+_CARD_FIELDS = itemgetter("id", "Lead Name", "Stage")
+
+
+def _set_leads_page(page: int):
+    """Callback to switch the lead cards page. Must be called via on_click."""
+    st.session_state.leads_page = page
+
+
+def _navigate_to_lead():
+    """Callback for the hidden lead navigation input. Must be called via on_change.
+
+    The lead-link script fills the input with the ID of a lead whose card is on
+    another page; the next run jumps to that page within this session instead
+    of reloading the app with a scroll_to query param.
+    """
+    lead_id = st.session_state.get("_lead_nav_request", "")
+    if lead_id:
+        st.session_state.scroll_to_lead = lead_id
+        st.session_state._scroll_page_pending = True
+    st.session_state._lead_nav_request = ""
+
+
+def _display_page_controls(page: int, total_pages: int, position: str):
+    """Display previous/next buttons and the current page indicator."""
+    prev_col, label_col, next_col = st.columns([1, 2, 1])
+    with prev_col:
+        st.button("← Previous", key=f"leads_page_prev_{position}", disabled=page == 0,
+                  use_container_width=True, on_click=_set_leads_page, args=(page - 1,))
+    with label_col:
+        st.markdown(f"<div style='text-align: center; color: #666; padding-top: 0.4rem;'>"
+                    f"Page {page + 1} of {total_pages}</div>", unsafe_allow_html=True)
+    with next_col:
+        st.button("Next →", key=f"leads_page_next_{position}", disabled=page >= total_pages - 1,
+                  use_container_width=True, on_click=_set_leads_page, args=(page + 1,))
+
+
+@st.fragment
+def _display_lead_card_body(lead: dict, lead_id: str | None):
+    """Display the contents of one lead card.
+
+    Expander bodies run even when collapsed, so the detail view (stage history,
+    notes) is only built once its toggle is switched on. Runs as a fragment so
+    flipping the toggle reruns just this card, not the whole dashboard.
+    """
+    if not lead_id:
+        # No ID to key the toggle on, and no history or notes to fetch, so the
+        # (cheap) details are shown directly
+        display_lead_detail(lead)
+    elif st.toggle("Show details", key=f"expanded_{lead_id}"):
+        display_lead_detail(lead)
+
+
 def display_lead_cards(leads: list[dict]):
     """Display leads as expandable cards with detail views.
 
     Cards have colored status indicators for quick visual identification.
+    Only one page of LEADS_PAGE_SIZE cards is rendered per run; a lead
+    navigated to from a lead link opens on the page containing it.
 
     Args:
         leads: List of formatted lead dictionaries
     """
-    # Prefetch stage histories and notes for all leads
-    _prefetch_stage_histories(leads)
-    _prefetch_notes(leads)
+    total_pages = max(1, -(-len(leads) // LEADS_PAGE_SIZE))
+
+    # Jump to the page holding a lead navigated to from another page. Its details
+    # are opened on this navigation run only, so the user can close them again.
+    open_lead_id = None
+    if st.session_state.pop("_scroll_page_pending", False):
+        # id -> position index, built once per filter result
+        lead_positions = _session_cached(
+            "lead_positions",
+            _current_filter_key(),
+            lambda: {lead.get("id"): i for i, lead in enumerate(leads)},
+        )
+        index = lead_positions.get(st.session_state.get("scroll_to_lead"))
+        if index is not None:
+            st.session_state.leads_page = index // LEADS_PAGE_SIZE
+            open_lead_id = st.session_state.scroll_to_lead
+        else:
+            # Lead is filtered out - drop the target so the scroll script ignores it
+            st.session_state.pop("scroll_to_lead", None)
 
-    # Show count
-    st.markdown(f"<div style='color: #666; margin-bottom: 0.5rem;'>Showing {len(leads)} leads</div>", unsafe_allow_html=True)
+    # Clamp page (filters may have shrunk the result set)
+    page = min(max(st.session_state.get("leads_page", 0), 0), total_pages - 1)
+    start = page * LEADS_PAGE_SIZE
+    visible_leads = leads[start:start + LEADS_PAGE_SIZE]
 
-    # Render all lead cards
-    for lead in leads:
-        lead_id = lead.get("id", "")
-        lead_name = lead.get("Lead Name", "Unknown")
-        stage = lead.get("Stage", "—")
-        status = lead.get("Status", "")
+    # Prefetch stage histories and notes for the current page only
+    _prefetch_stage_histories(visible_leads)
+    _prefetch_notes(visible_leads)
 
-        # Get colored circle indicator based on status (uses existing helper)
-        status_emoji = get_status_emoji(status)
+    # Show count
+    if total_pages > 1:
+        count_text = f"Showing {start + 1}–{start + len(visible_leads)} of {len(leads)} leads"
+    else:
+        count_text = f"Showing {len(leads)} leads"
+    st.markdown(f"<div style='color: #666; margin-bottom: 0.5rem;'>{count_text}</div>", unsafe_allow_html=True)
+
+    if total_pages > 1:
+        _display_page_controls(page, total_pages, "top")
+
+    # Header fields for each card, fetched once per lead
+    card_fields = [_CARD_FIELDS(lead) for lead in visible_leads]
+
+    # Anchors for scrolling, with a data attribute for the lead name, emitted as one
+    # element for the page. The scroll script only reads them to find the lead's
+    # expander by name, so they need not sit next to each card.
+    st.markdown("".join(
+        f'<div id="lead-{_escape_html(lead_id)}" data-leadname="{_escape_html(lead_name)}"></div>'
+        for lead_id, lead_name, _ in card_fields
+    ), unsafe_allow_html=True)
+
+    # Render lead cards for the current page
+    for lead, (lead_id, lead_name, stage) in zip(visible_leads, card_fields):
+        # Get colored circle indicator from the precomputed status key
+        status_emoji = get_lead_status_emoji(lead)
         emoji_prefix = f"{status_emoji} " if status_emoji else ""
 
         expander_label = f"{emoji_prefix}{lead_name} — {stage}"
 
-        # Add anchor for scrolling with data attribute for lead name
-        st.markdown(f'<div id="lead-{lead_id}" data-leadname="{lead_name}"></div>', unsafe_allow_html=True)
-
+        if lead_id == open_lead_id:
+            st.session_state[f"expanded_{lead_id}"] = True
         with st.expander(expander_label, expanded=False):
-            display_lead_detail(lead)
+            _display_lead_card_body(lead, lead_id)
 
+    if total_pages > 1:
+        _display_page_controls(page, total_pages, "bottom")
 
-def _capture_daily_snapshot(display_data: list[dict]):
+
+def _capture_daily_snapshot(display_data: list[dict], today: date):
     """Capture today's status snapshot if not already captured.
 
     Called once per day on dashboard load to track trends.
-    Uses session state to avoid repeated Supabase queries on reruns.
+    Session state remembers the date last checked, so reruns skip the
+    Supabase query while a session left open past midnight checks again.
     """
+    ss = st.session_state
+
     # Check session state first to avoid repeated Supabase queries
-    if st.session_state.get("_snapshot_checked_today"):
+    if ss.get("_snapshot_date") == today:
         return
 
-    from src.cache import get_today_snapshot, save_status_snapshot
+    # Calculate counts from unfiltered data and save, unless already captured today
+    if get_today_snapshot() is None:
+        save_status_snapshot(_unfiltered_aggregates(display_data)["status_counts"])
+    ss._snapshot_date = today
 
-    # Check if already captured today (Supabase query)
-    if get_today_snapshot() is not None:
-        st.session_state._snapshot_checked_today = True
-        return
 
-    # Calculate counts from unfiltered data and save
-    counts = count_leads_by_status(display_data)
-    save_status_snapshot(counts)
-    st.session_state._snapshot_checked_today = True
+# Chart sections below the metrics; only the selected one is built each run
+CHART_SECTIONS = ("Pipeline", "Status & Timeline", "Trends")
 
 
 def display_dashboard():
     """Main dashboard display logic."""
+    ss = st.session_state
+
+    # Single clock read for every date-relative view in this run
+    today = datetime.now(timezone.utc).date()
+
     # Initialize last_refresh from cache if not set (for fresh page loads)
-    if "last_refresh" not in st.session_state:
-        from src.cache import get_leads_cache_age
+    if "last_refresh" not in ss:
         cache_age = get_leads_cache_age()
         if cache_age:
-            st.session_state.last_refresh = cache_age
+            ss.last_refresh = cache_age
 
     # Display header with refresh controls
     display_header()
@@ -1675,22 +2130,28 @@ def display_dashboard():
     st.divider()
 
     # Check if we need to fetch data
-    if "leads" not in st.session_state:
+    if "leads" not in ss or "deliveries" not in ss:
         # Check if this is a forced refresh (bypass cache)
-        bypass_cache = st.session_state.pop("bypass_cache", False)
-        is_refresh = st.session_state.get("refreshing", False)
+        bypass_cache = ss.pop("bypass_cache", False)
+        is_refresh = ss.get("refreshing", False)
 
         if is_refresh:
             # Show detailed progress for manual refresh
             progress_bar = st.progress(0, text="Refreshing data from Zoho CRM...")
 
-            progress_bar.progress(10, text="Fetching leads...")
+            # Deliveries are an independent query, so fetch them while leads load
+            deliveries_future = start_background_deliveries_fetch() if bypass_cache else None
+
+            progress_bar.progress(10, text="Fetching leads and deliveries...")
             fetch_and_cache_leads(bypass_cache=bypass_cache)
 
             progress_bar.progress(30, text="Fetching deliveries...")
-            fetch_and_cache_deliveries(bypass_cache=bypass_cache)
+            if deliveries_future is not None:
+                _store_fetched_deliveries(finish_background_deliveries_fetch(deliveries_future))
+            else:
+                fetch_and_cache_deliveries(bypass_cache=bypass_cache)
 
-            leads = st.session_state.get("leads", [])
+            leads = ss.get("leads", [])
             if leads:
                 progress_bar.progress(50, text="Loading stage histories...")
                 _prefetch_stage_histories(leads)
@@ -1699,16 +2160,19 @@ def display_dashboard():
                 _prefetch_notes(leads)
 
             progress_bar.progress(100, text="Refresh complete!")
-            import time
             time.sleep(0.5)  # Brief pause to show completion
             progress_bar.empty()  # Remove progress bar
         else:
-            # Simple spinner for initial page load
-            with st.spinner("Loading leads..."):
-                fetch_and_cache_leads(bypass_cache=bypass_cache)
-                fetch_and_cache_deliveries(bypass_cache=bypass_cache)
+            # Initial page load: fetch leads and deliveries on worker threads and poll
+            # for the results so the header and Refresh button stay interactive meanwhile
+            leads_ready = "leads" in ss or _poll_background_leads_fetch()
+            deliveries_ready = _poll_background_deliveries_fetch()
+            if not (leads_ready and deliveries_ready):
+                st.caption("Loading leads from Zoho CRM…")
+                time.sleep(0.3)
+                st.rerun()
 
-    leads = st.session_state.get("leads", [])
+    leads = ss.get("leads", [])
 
     # Check for errors - if error and no data, show error with retry
     error = get_last_error()
@@ -1727,14 +2191,15 @@ def display_dashboard():
 
         # Cache key for formatted display data
         # Changes when leads or deliveries data changes
-        deliveries = st.session_state.get("deliveries", [])
-        display_cache_key = f"display_{len(leads)}_{len(deliveries)}"
-        if leads:
-            display_cache_key += f"_{leads[0].get('id', '')}_{leads[-1].get('id', '')}"
+        deliveries = ss.get("deliveries", [])
+        display_cache_key = (
+            ss.get("leads_token"),
+            ss.get("deliveries_token"),
+        )
 
         # Use cached display data if available (avoids expensive v2 classification on every filter change)
-        if st.session_state.get("_display_cache_key") == display_cache_key and "_display_data" in st.session_state:
-            display_data = st.session_state._display_data
+        if ss.get("_display_cache_key") == display_cache_key and "_display_data" in ss:
+            display_data = ss._display_data
         else:
             # Prefetch stage histories and notes for classification (if not already done during refresh)
             # This must happen before format_leads_for_display for v2 classification
@@ -1751,90 +2216,102 @@ def display_dashboard():
                 lead_id = lead.get("id")
                 if lead_id:
                     notes_key = f"notes_{lead_id}"
-                    if notes_key in st.session_state:
-                        notes[lead_id] = st.session_state[notes_key]
+                    if notes_key in ss:
+                        notes[lead_id] = ss[notes_key]
 
             # Format leads for display with v2 classification
             display_data = format_leads_for_display(leads, stage_histories, notes, deliveries)
 
-            # Cache the formatted data
-            st.session_state._display_cache_key = display_cache_key
-            st.session_state._display_data = display_data
+            # Cache the formatted data; bumping the version invalidates derived caches
+            ss._display_cache_key = display_cache_key
+            ss._display_data = display_data
+            ss._display_version = ss.get("_display_version", 0) + 1
 
         # Capture daily status snapshot for trend tracking (uses unfiltered data)
-        _capture_daily_snapshot(display_data)
+        _capture_daily_snapshot(display_data, today)
 
-        # Display filters and get filtered data (Story 3.1)
-        filtered_data = display_filters(display_data)
+        # Display filters and get filtered, sorted data with its aggregates (Stories 3.1, 3.2)
+        filtered_view = display_filters(display_data)
+        filtered_data = filtered_view["leads"]
+        aggregates = filtered_view["aggregates"]
 
-        # Sort filtered data by selected option (Story 3.2)
-        filtered_data = sort_leads(filtered_data, st.session_state.sort_option)
+        # Handle empty filtered results before building any summaries or charts (AC#12)
+        n_filt, n_total = len(filtered_data), len(display_data)
+        if n_filt == 0:
+            st.markdown(f"**Showing 0 of {n_total} leads** (filtered)")
+            st.info("No leads match your current filters. Try adjusting the filters or click 'Reset All Filters' above.")
+            return
 
         # Display summary metrics cards with filtered data (Story 2.6, AC#2, AC#5, AC#10)
-        display_metrics_cards(filtered_data)
+        display_metrics_cards(aggregates["status_counts"])
 
         st.divider()
 
+        status_buckets = filtered_view["status_buckets"]
+
         # Display priority list - at risk leads (most actionable)
-        display_priority_list(filtered_data)
+        display_priority_list(status_buckets["at_risk"])
 
         # Display needs attention list
-        display_needs_attention_list(filtered_data)
+        display_needs_attention_list(status_buckets["needs_attention"])
 
         st.divider()
 
-        # Display visualizations side by side
-        viz_col1, viz_col2 = st.columns(2)
-
-        with viz_col1:
-            display_stage_pipeline(filtered_data)
+        # Only the selected chart section is built; the others cost nothing this run
+        chart_section = st.radio(
+            "Charts",
+            CHART_SECTIONS,
+            horizontal=True,
+            key="chart_section",
+            label_visibility="collapsed",
+        )
 
-        with viz_col2:
-            display_locator_workload(filtered_data)
+        if chart_section == "Pipeline":
+            # Display visualizations side by side
+            viz_col1, viz_col2 = st.columns(2)
 
-        st.divider()
+            with viz_col1:
+                display_stage_pipeline(aggregates["stage_counts"])
 
-        # Display status distribution and appointments timeline
-        # Hide distribution chart when status filter is active (becomes meaningless)
-        status_filter_active = st.session_state.get("filter_status", ALL_STATUSES) != ALL_STATUSES
+            with viz_col2:
+                display_locator_workload(aggregates["locator_workload"])
 
-        if status_filter_active:
-            # Just show timeline at full width when distribution is hidden
-            display_appointments_timeline(filtered_data)
-        else:
-            chart_col1, chart_col2 = st.columns(2)
-            with chart_col1:
-                display_status_donut(filtered_data)
-            with chart_col2:
-                display_appointments_timeline(filtered_data)
+        elif chart_section == "Status & Timeline":
+            # Display status distribution and appointments timeline
+            # Hide distribution chart when status filter is active (becomes meaningless)
+            status_filter_active = ss.get("filter_status", ALL_STATUSES) != ALL_STATUSES
 
-        st.divider()
-
-        # Display status trend over time (uses all data, not filtered)
-        display_status_trend(display_data)
+            if status_filter_active:
+                # Just show timeline at full width when distribution is hidden
+                display_appointments_timeline(aggregates["appointment_days"], today)
+            else:
+                chart_col1, chart_col2 = st.columns(2)
+                with chart_col1:
+                    display_status_donut(aggregates["status_counts"])
+                with chart_col2:
+                    display_appointments_timeline(aggregates["appointment_days"], today)
 
-        # Display conversion funnel and closing ratio side by side
-        date_filter = st.session_state.get("filter_date_range", DEFAULT_DATE_RANGE)
-        if date_filter not in ("Last 7 Days + Future", "Future"):
-            st.divider()
-            funnel_col, ratio_col = st.columns(2)
-            with funnel_col:
-                display_conversion_funnel(filtered_data)
-            with ratio_col:
-                display_closing_ratio(filtered_data, display_data)
+        else:
+            # Display status trend over time (uses all data, not filtered)
+            display_status_trend(display_data, today)
+
+            # Display conversion funnel and closing ratio side by side
+            date_filter = ss.get("filter_date_range", DEFAULT_DATE_RANGE)
+            if date_filter not in ("Last 7 Days + Future", "Future"):
+                st.divider()
+                funnel_col, ratio_col = st.columns(2)
+                with funnel_col:
+                    display_conversion_funnel(filtered_data)
+                with ratio_col:
+                    display_closing_ratio(filtered_data, display_data, today)
 
         st.divider()
 
         # Display lead count - show filtered vs total if filters active
-        if len(filtered_data) == len(display_data):
-            st.markdown(f"**Showing {len(filtered_data)} leads with appointments**")
+        if n_filt == n_total:
+            st.markdown(f"**Showing {n_filt} leads with appointments**")
         else:
-            st.markdown(f"**Showing {len(filtered_data)} of {len(display_data)} leads** (filtered)")
-
-        # Handle empty filtered results (AC#12)
-        if not filtered_data:
-            st.info("No leads match your current filters. Try adjusting the filters or click 'Reset All Filters' above.")
-            return
+            st.markdown(f"**Showing {n_filt} of {n_total} leads** (filtered)")
 
         # Display leads as expandable cards (Story 4.1)
         display_lead_cards(filtered_data)
@@ -1848,8 +2325,17 @@ display_dashboard()
 # Add JavaScript for lead navigation (must be at end after all content rendered)
 import streamlit.components.v1 as components
 
-# Get current scroll target for JS (set at top of file from query param)
-current_scroll_target = st.session_state.get("scroll_to_lead", "")
+# Hidden input (see CSS) through which the script below requests a lead on another
+# page, so navigation reruns this session rather than reloading the app
+st.text_input(
+    "Lead navigation",
+    key="_lead_nav_request",
+    on_change=_navigate_to_lead,
+    label_visibility="collapsed",
+)
+
+# Scroll target for JS, consumed by this run so later reruns don't keep targeting it
+current_scroll_target = st.session_state.pop("scroll_to_lead", "")
 
 components.html(f"""
 <script>
@@ -1857,11 +2343,30 @@ components.html(f"""
     const doc = window.parent.document;
     const scrollTarget = "{current_scroll_target}";
 
+    // Ask the app to show the page holding a lead, via the hidden navigation input
+    const requestLeadPage = (leadId) => {{
+        const input = doc.querySelector('input[aria-label="Lead navigation"]');
+        if (!input) {{
+            return false;
+        }}
+        const setValue = Object.getOwnPropertyDescriptor(
+            window.parent.HTMLInputElement.prototype, 'value'
+        ).set;
+        setValue.call(input, leadId);
+        input.dispatchEvent(new Event('input', {{bubbles: true}}));
+        input.dispatchEvent(new KeyboardEvent('keydown', {{key: 'Enter', keyCode: 13, bubbles: true}}));
+        return true;
+    }};
+
     // Scroll to lead and expand
     const scrollToLead = (leadId) => {{
         const anchor = doc.getElementById('lead-' + leadId);
         if (!anchor) {{
-            // Lead not on current page - redirect with query param to navigate
+            // Lead not on current page - switch pages in this session
+            if (requestLeadPage(leadId)) {{
+                return;
+            }}
+            // Fall back to reloading with a query param to navigate
             const currentUrl = new URL(window.parent.location.href);
             currentUrl.searchParams.set('scroll_to', leadId);
             window.parent.location.href = currentUrl.toString();
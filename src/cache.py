@@ -7,6 +7,7 @@ Caches:
 """
 import json
 import logging
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
@@ -268,6 +269,35 @@ def clear_cache(lead_id: Optional[str] = None) -> bool:
         return False
 
 
+# --- Shared List Reads ---
+
+# How long a leads_cache row read is reused by other sessions in this process
+LIST_MEMO_TTL_SECONDS = 60
+
+# Last read of each leads_cache row, shared by all sessions:
+# {cache_key: (read_at monotonic, cached_at, data)}
+_list_memo: dict[str, tuple[float, datetime, list]] = {}
+
+
+def _get_memoized_list(cache_key: str) -> Optional[tuple[datetime, list]]:
+    """Return (cached_at, data) from a recent read of a leads_cache row, or None."""
+    memo = _list_memo.get(cache_key)
+    if memo is None:
+        return None
+
+    read_at, cached_at, data = memo
+    if time.monotonic() - read_at >= LIST_MEMO_TTL_SECONDS:
+        return None
+    if datetime.now(timezone.utc) - cached_at > timedelta(hours=CACHE_TTL_HOURS):
+        return None
+    return cached_at, data
+
+
+def _memoize_list(cache_key: str, cached_at: datetime, data: list):
+    """Remember a leads_cache row read or write for other sessions."""
+    _list_memo[cache_key] = (time.monotonic(), cached_at, data)
+
+
 # --- Leads List Cache ---
 
 LEADS_CACHE_KEY = "leads_with_appointments"
@@ -277,10 +307,20 @@ def get_cached_leads() -> Optional[list]:
     """
     Get cached leads list.
 
+    Reads within LIST_MEMO_TTL_SECONDS of the last one reuse its result
+    instead of querying Supabase again. The returned list is shared between
+    sessions and must be treated as read-only.
+
     Returns:
         List of lead dictionaries if cached and not expired, None otherwise.
         Also stores the cached_at timestamp in session state for get_leads_cache_age().
     """
+    memo = _get_memoized_list(LEADS_CACHE_KEY)
+    if memo is not None:
+        cached_at, data = memo
+        st.session_state._leads_cached_at = cached_at
+        return data
+
     client = _get_supabase_client()
     if not client:
         return None
@@ -301,6 +341,7 @@ def get_cached_leads() -> Optional[list]:
 
         # Store cached_at in session state to avoid duplicate query in get_leads_cache_age()
         st.session_state._leads_cached_at = cached_at
+        _memoize_list(LEADS_CACHE_KEY, cached_at, record["data"])
 
         logger.info("Leads cache hit (%d leads)", len(record["data"]))
         return record["data"]
@@ -356,11 +397,13 @@ def set_cached_leads(leads: list) -> bool:
         return False
 
     try:
+        cached_at = datetime.now(timezone.utc)
         client.table("leads_cache").upsert({
             "cache_key": LEADS_CACHE_KEY,
             "data": leads,
-            "cached_at": datetime.now(timezone.utc).isoformat(),
+            "cached_at": cached_at.isoformat(),
         }).execute()
+        _memoize_list(LEADS_CACHE_KEY, cached_at, leads)
 
         logger.info("Cached %d leads", len(leads))
         return True
@@ -377,6 +420,8 @@ def clear_leads_cache() -> bool:
     Returns:
         True if cleared successfully, False otherwise
     """
+    _list_memo.pop(LEADS_CACHE_KEY, None)
+
     client = _get_supabase_client()
     if not client:
         return False
@@ -400,9 +445,17 @@ def get_cached_deliveries() -> Optional[list]:
     """
     Get cached deliveries list.
 
+    Reads within LIST_MEMO_TTL_SECONDS of the last one reuse its result
+    instead of querying Supabase again. The returned list is shared between
+    sessions and must be treated as read-only.
+
     Returns:
         List of delivery dictionaries if cached and not expired, None otherwise.
     """
+    memo = _get_memoized_list(DELIVERIES_CACHE_KEY)
+    if memo is not None:
+        return memo[1]
+
     client = _get_supabase_client()
     if not client:
         return None
@@ -421,6 +474,7 @@ def get_cached_deliveries() -> Optional[list]:
             logger.info("Deliveries cache expired")
             return None
 
+        _memoize_list(DELIVERIES_CACHE_KEY, cached_at, record["data"])
         logger.info("Deliveries cache hit (%d records)", len(record["data"]))
         return record["data"]
 
@@ -444,11 +498,13 @@ def set_cached_deliveries(deliveries: list) -> bool:
         return False
 
     try:
+        cached_at = datetime.now(timezone.utc)
         client.table("leads_cache").upsert({
             "cache_key": DELIVERIES_CACHE_KEY,
             "data": deliveries,
-            "cached_at": datetime.now(timezone.utc).isoformat(),
+            "cached_at": cached_at.isoformat(),
         }).execute()
+        _memoize_list(DELIVERIES_CACHE_KEY, cached_at, deliveries)
 
         logger.info("Cached %d deliveries", len(deliveries))
         return True
@@ -465,6 +521,8 @@ def clear_deliveries_cache() -> bool:
     Returns:
         True if cleared successfully, False otherwise
     """
+    _list_memo.pop(DELIVERIES_CACHE_KEY, None)
+
     client = _get_supabase_client()
     if not client:
         return False
@@ -630,8 +688,6 @@ def get_cached_notes(lead_ids: list[str]) -> dict[str, dict]:
         Dict mapping lead_id to dict with 'content' and 'time' keys.
         Leads with NO_NOTES_MARKER are returned with empty content.
     """
-    import streamlit as st
-
     if not lead_ids:
         return {}
 
@@ -745,8 +801,6 @@ def clear_notes_cache() -> bool:
     Returns:
         True if cleared successfully, False otherwise
     """
-    import streamlit as st
-
     # Clear session state cache
     st.session_state.pop("notes_cache_session", None)
 
@@ -10,7 +10,10 @@ Responsibilities:
 """
 import logging
 import platform
+import sys
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
+from operator import itemgetter
 from typing import Optional
 
 from rapidfuzz import fuzz
@@ -628,6 +631,21 @@ def format_date(dt: Optional[datetime]) -> str:
     return dt.strftime("%b %-d, %Y")
 
 
+def format_date_numeric(dt: Optional[datetime]) -> str:
+    """
+    Format datetime as '01.07.2026' (MM.DD.YYYY) for compact tables.
+
+    Args:
+        dt: datetime object or None
+
+    Returns:
+        Formatted date string or "—" if None
+    """
+    if dt is None:
+        return "—"
+    return dt.strftime("%m.%d.%Y")
+
+
 def safe_display(value: Optional[str]) -> str:
     """
     Return value or '—' for None/empty values.
@@ -706,9 +724,11 @@ def format_leads_for_display(
         - id (for fetching stage history)
         - Lead Name
         - Appointment Date
+        - appointment_date_numeric: Appointment date as MM.DD.YYYY for compact tables
         - Days (days since appointment)
         - days_since_activity (days since last stage change, note, or modification)
         - Status: stale, at_risk, needs_attention, healthy
+        - status_key: Canonical status key for aggregation (None counts as healthy)
         - classification_reason: Human-readable reason for the classification
         - Stage
         - Locator
@@ -751,16 +771,20 @@ def format_leads_for_display(
             # Use days since modification as activity proxy
             days_since_activity = days_since_modified
 
+        appointment_date = lead.get("appointment_date")
         result.append({
             "id": lead_id,
             "Lead Name": safe_display(lead.get("name")),
-            "Appointment Date": format_date(lead.get("appointment_date")),
+            "Appointment Date": format_date(appointment_date),
+            "appointment_date_numeric": format_date_numeric(appointment_date),
             "Days": days,
             "days_since_activity": days_since_activity,
             "Status": format_status_display(status),
+            "status_key": status if status in STATUS_CONFIG else "healthy",
             "classification_reason": classification_reason,
-            "Stage": safe_display(lead.get("current_stage")),
-            "Locator": safe_display(lead.get("locator_name")),
+            # Interned: few distinct values shared by every lead, compared on each filter/aggregation
+            "Stage": sys.intern(safe_display(stage)),
+            "Locator": sys.intern(safe_display(lead.get("locator_name"))),
             "Phone": format_phone_link(lead.get("locator_phone")),
             "Email": format_email_link(lead.get("locator_email")),
             "zoho_link": format_zoho_link(lead_id) if lead_id else None,
@@ -771,6 +795,10 @@ def format_leads_for_display(
     return result
 
 
+# Sort rank for each status key (most urgent first)
+_URGENCY_PRIORITY = {"stale": 0, "at_risk": 1, "needs_attention": 2, "healthy": 3}
+
+
 def sort_by_urgency(leads: list[dict]) -> list[dict]:
     """
     Sort leads by urgency: stale first, then at_risk, then needs_attention, then healthy.
@@ -785,18 +813,10 @@ def sort_by_urgency(leads: list[dict]) -> list[dict]:
         New list sorted by urgency
     """
     def sort_key(lead):
-        status = lead.get("Status") or ""
         days = lead.get("Days")
 
         # Status priority: stale=0, at_risk=1, needs_attention=2, healthy/other=3
-        if "stale" in status:
-            priority = 0
-        elif "at_risk" in status:
-            priority = 1
-        elif "needs_attention" in status:
-            priority = 2
-        else:
-            priority = 3
+        priority = _URGENCY_PRIORITY[get_lead_status_key(lead)]
 
         # Days: higher is more urgent (negate for descending), None goes last
         days_value = -days if days is not None else float("inf")
@@ -820,15 +840,7 @@ def count_leads_by_status(leads: list[dict]) -> dict[str, int]:
     """
     counts = {"stale": 0, "at_risk": 0, "needs_attention": 0, "healthy": 0}
     for lead in leads:
-        status = lead.get("Status") or ""
-        if "stale" in status:
-            counts["stale"] += 1
-        elif "at_risk" in status:
-            counts["at_risk"] += 1
-        elif "needs_attention" in status:
-            counts["needs_attention"] += 1
-        else:
-            counts["healthy"] += 1
+        counts[get_lead_status_key(lead)] += 1
     return counts
 
 
@@ -844,6 +856,55 @@ def _get_status_key(status: str) -> str:
     return "healthy"
 
 
+def get_lead_status_key(lead: dict) -> str:
+    """
+    Get the canonical status key for a formatted lead.
+
+    Uses the status_key precomputed by format_leads_for_display() and only
+    falls back to parsing the formatted Status string when it is absent.
+
+    Args:
+        lead: Formatted lead dictionary
+
+    Returns:
+        One of 'stale', 'at_risk', 'needs_attention', 'healthy'
+    """
+    return lead.get("status_key") or _get_status_key(lead.get("Status"))
+
+
+def get_lead_status_emoji(lead: dict) -> str:
+    """
+    Get the status emoji for a formatted lead.
+
+    Args:
+        lead: Formatted lead dictionary
+
+    Returns:
+        Status emoji ('🔴', '🟡', '🟠', '🟢'), or empty string for a lead
+        without a status (no appointment date)
+    """
+    if lead.get("Status") is None:
+        return ""
+    return STATUS_EMOJI_MAP[get_lead_status_key(lead)]
+
+
+def bucket_leads_by_status(leads: list[dict]) -> dict[str, list[dict]]:
+    """
+    Group leads by status category in a single pass.
+
+    Args:
+        leads: List of formatted lead dictionaries (from format_leads_for_display)
+
+    Returns:
+        Dictionary of lead lists keyed by 'stale', 'at_risk', 'needs_attention'
+        and 'healthy'. Each list preserves the input order.
+    """
+    buckets = {"stale": [], "at_risk": [], "needs_attention": [], "healthy": []}
+    for lead in leads:
+        buckets[get_lead_status_key(lead)].append(lead)
+    return buckets
+
+
 def get_about_to_go_stale(leads: list[dict]) -> list[dict]:
     """
     Get leads that are about to go stale (at_risk status, 5-6 days).
@@ -861,11 +922,10 @@ def get_about_to_go_stale(leads: list[dict]) -> list[dict]:
     priority_leads = []
 
     for lead in leads:
-        status = lead.get("Status") or ""
         days = lead.get("Days")
 
         # Only include at_risk leads (5-6 days)
-        if "at_risk" in status.lower() and days is not None:
+        if days is not None and get_lead_status_key(lead) == "at_risk":
             # Calculate days until stale
             days_until_stale = STALE_THRESHOLD_DAYS - days
 
@@ -879,6 +939,11 @@ def get_about_to_go_stale(leads: list[dict]) -> list[dict]:
     return priority_leads
 
 
+# Sort keys for the stage/locator aggregates, used with reverse=True (sort stays stable)
+_STAGE_SORT_KEY = itemgetter("count")
+_LOCATOR_URGENCY_KEY = itemgetter("stale", "at_risk", "needs_attention", "total")
+
+
 def count_leads_by_stage(leads: list[dict]) -> list[dict]:
     """
     Count leads by stage for pipeline visualization.
@@ -900,11 +965,10 @@ def count_leads_by_stage(leads: list[dict]) -> list[dict]:
             stage_data[stage] = {"stage": stage, "count": 0, "stale": 0, "at_risk": 0, "needs_attention": 0, "healthy": 0}
 
         stage_data[stage]["count"] += 1
-        status_key = _get_status_key(lead.get("Status"))
-        stage_data[stage][status_key] += 1
+        stage_data[stage][get_lead_status_key(lead)] += 1
 
     # Sort by count descending
-    return sorted(stage_data.values(), key=lambda x: x["count"], reverse=True)
+    return sorted(stage_data.values(), key=_STAGE_SORT_KEY, reverse=True)
 
 
 def get_locator_workload(leads: list[dict]) -> list[dict]:
@@ -935,19 +999,90 @@ def get_locator_workload(leads: list[dict]) -> list[dict]:
             }
 
         locator_data[locator]["total"] += 1
-        status_key = _get_status_key(lead.get("Status"))
-        locator_data[locator][status_key] += 1
+        locator_data[locator][get_lead_status_key(lead)] += 1
 
     # Sort by urgency: stale first, then at_risk, then needs_attention, then by total
-    def urgency_sort(item):
-        return (
-            -item["stale"],
-            -item["at_risk"],
-            -item["needs_attention"],
-            -item["total"],
-        )
+    return sorted(locator_data.values(), key=_LOCATOR_URGENCY_KEY, reverse=True)
+
+
+# Column order of the aggregate tables returned by compute_status_aggregates()
+_STAGE_COUNT_FIELDS = ("stage", "count", "stale", "at_risk", "needs_attention", "healthy")
+_LOCATOR_WORKLOAD_FIELDS = ("locator", "total", "stale", "at_risk", "needs_attention", "healthy")
+
+
+def compute_status_aggregates(leads: list[dict]) -> dict:
+    """
+    Compute status counts, stage counts, locator workload and the appointment
+    timeline inputs in a single pass.
+
+    Produces the same results as count_leads_by_status(), count_leads_by_stage()
+    and get_locator_workload() without walking the lead list three times. Stage
+    and locator rows are returned as columns (one list per field) so charts and
+    tables can take each series directly.
+
+    Args:
+        leads: List of formatted lead dictionaries (from format_leads_for_display)
+
+    Returns:
+        Dictionary with keys:
+        - status_counts: {"stale": N, "at_risk": N, "needs_attention": N, "healthy": N}
+        - stage_counts: {"stage": [...], "count": [...], "stale": [...], ...},
+          rows sorted by count descending
+        - locator_workload: {"locator": [...], "total": [...], "stale": [...], ...},
+          rows sorted by urgency
+        - appointment_days: {"days": [...], "status_key": [...]} for leads with
+          a Days value, in lead order
+    """
+    counts = {"stale": 0, "at_risk": 0, "needs_attention": 0, "healthy": 0}
+    stage_data = {}
+    locator_data = {}
+    appointment_days = []
+    appointment_statuses = []
 
-    return sorted(locator_data.values(), key=urgency_sort)
+    for lead in leads:
+        status_key = get_lead_status_key(lead)
+        counts[status_key] += 1
+
+        days = lead.get("Days")
+        if days is not None:
+            appointment_days.append(days)
+            appointment_statuses.append(status_key)
+
+        stage = lead.get("Stage") or "Unknown"
+        if stage == "—":
+            stage = "Unknown"
+        stage_row = stage_data.get(stage)
+        if stage_row is None:
+            stage_row = stage_data[stage] = {
+                "stage": stage, "count": 0, "stale": 0, "at_risk": 0, "needs_attention": 0, "healthy": 0
+            }
+        stage_row["count"] += 1
+        stage_row[status_key] += 1
+
+        locator = lead.get("Locator") or "Unknown"
+        if locator == "—":
+            locator = "Unknown"
+        locator_row = locator_data.get(locator)
+        if locator_row is None:
+            locator_row = locator_data[locator] = {
+                "locator": locator, "total": 0, "stale": 0, "at_risk": 0, "needs_attention": 0, "healthy": 0
+            }
+        locator_row["total"] += 1
+        locator_row[status_key] += 1
+
+    stage_rows = sorted(stage_data.values(), key=_STAGE_SORT_KEY, reverse=True)
+    locator_rows = sorted(locator_data.values(), key=_LOCATOR_URGENCY_KEY, reverse=True)
+    return {
+        "status_counts": counts,
+        "stage_counts": _rows_to_columns(stage_rows, _STAGE_COUNT_FIELDS),
+        "locator_workload": _rows_to_columns(locator_rows, _LOCATOR_WORKLOAD_FIELDS),
+        "appointment_days": {"days": appointment_days, "status_key": appointment_statuses},
+    }
+
+
+def _rows_to_columns(rows: list[dict], fields: tuple[str, ...]) -> dict[str, list]:
+    """Transpose a list of row dicts into a dict of column lists."""
+    return {field: [row[field] for row in rows] for field in fields}
 
 
 # Filter constants
@@ -1027,29 +1162,36 @@ def filter_by_date_range(leads: list[dict], date_range: str) -> list[dict]:
     """
     if date_range == ALL_DATES:
         return leads
+    bounds = _DATE_RANGE_BOUNDS.get(date_range, _EMPTY_DATE_RANGE)
+    return [lead for lead in leads if _in_date_range(lead.get("Days"), bounds)]
+
+
+# Inclusive (min, max) days-since-appointment bounds for each date range preset.
+# Future appointments have negative days, so "+ Future" presets are unbounded below.
+_DATE_RANGE_BOUNDS = {
+    "Future": (float("-inf"), -1),
+    "Last 7 Days + Future": (float("-inf"), 6),
+    "Last 30 Days + Future": (float("-inf"), 29),
+    "Last 90 Days + Future": (float("-inf"), 89),
+    "Last 6 Months": (0, 182),
+}
 
-    result = []
-    for lead in leads:
-        days = lead.get("Days")
-        if days is None:
-            continue
+# Bounds that match nothing, for unrecognised presets
+_EMPTY_DATE_RANGE = (1, 0)
 
-        include = False
-        if date_range == "Future":
-            include = days < 0
-        elif date_range == "Last 7 Days + Future":
-            include = days < 0 or (0 <= days <= 6)
-        elif date_range == "Last 30 Days + Future":
-            include = days < 0 or (0 <= days <= 29)
-        elif date_range == "Last 90 Days + Future":
-            include = days < 0 or (0 <= days <= 89)
-        elif date_range == "Last 6 Months":
-            include = 0 <= days <= 182
-
-        if include:
-            result.append(lead)
 
-    return result
+def _in_date_range(days: Optional[int], bounds: tuple[float, float]) -> bool:
+    """Check whether a lead's days-since-appointment falls within preset bounds."""
+    return days is not None and bounds[0] <= days <= bounds[1]
+
+
+# Map status filter option to status key
+_STATUS_FILTER_KEYS = {
+    "Stale": "stale",
+    "At Risk": "at_risk",
+    "Needs Attention": "needs_attention",
+    "Healthy": "healthy",
+}
 
 
 def filter_by_status(leads: list[dict], status_filter: str) -> list[dict]:
@@ -1067,31 +1209,12 @@ def filter_by_status(leads: list[dict], status_filter: str) -> list[dict]:
     if status_filter == ALL_STATUSES:
         return leads
 
-    # Map filter option to status keyword in the formatted Status field
-    status_keywords = {
-        "Stale": "stale",
-        "At Risk": "at_risk",
-        "Needs Attention": "needs_attention",
-        "Healthy": "healthy",
-    }
-
-    keyword = status_keywords.get(status_filter)
+    keyword = _STATUS_FILTER_KEYS.get(status_filter)
     if not keyword:
         return leads
 
-    result = []
-    for lead in leads:
-        status = lead.get("Status") or ""
-        status_lower = status.lower()
-
-        if keyword == "healthy":
-            # Healthy is anything that's not stale, at_risk, or needs_attention
-            if "stale" not in status_lower and "at_risk" not in status_lower and "needs_attention" not in status_lower:
-                result.append(lead)
-        elif keyword in status_lower:
-            result.append(lead)
-
-    return result
+    # Healthy is anything that's not stale, at_risk, or needs_attention
+    return [lead for lead in leads if get_lead_status_key(lead) == keyword]
 
 
 def apply_filters(
@@ -1102,7 +1225,7 @@ def apply_filters(
     status_filter: str = ALL_STATUSES,
 ) -> list[dict]:
     """
-    Apply all filters in sequence (AND logic).
+    Apply all filters (AND logic) in a single pass over the leads.
 
     Args:
         leads: List of formatted lead dictionaries
@@ -1112,13 +1235,36 @@ def apply_filters(
         status_filter: Status filter value
 
     Returns:
-        List of leads matching ALL filter criteria
-    """
-    result = leads
-    result = filter_by_stage(result, stage)
-    result = filter_by_locator(result, locator)
-    result = filter_by_date_range(result, date_range)
-    result = filter_by_status(result, status_filter)
+        List of leads matching ALL filter criteria. When every filter is at
+        its "All" sentinel the input list itself is returned (no copy).
+    """
+    if (
+        stage == ALL_STAGES
+        and locator == ALL_LOCATORS
+        and date_range == ALL_DATES
+        and status_filter == ALL_STATUSES
+    ):
+        return leads
+
+    # Resolve each filter once; None means the filter is inactive
+    stage_value = None if stage == ALL_STAGES else stage
+    locator_lower = None if locator == ALL_LOCATORS else locator.lower()
+    date_bounds = None if date_range == ALL_DATES else _DATE_RANGE_BOUNDS.get(date_range, _EMPTY_DATE_RANGE)
+    status_key = None if status_filter == ALL_STATUSES else _STATUS_FILTER_KEYS.get(status_filter)
+
+    result = []
+    for lead in leads:
+        if stage_value is not None and lead.get("Stage") != stage_value:
+            continue
+        if locator_lower is not None:
+            lead_locator = lead.get("Locator")
+            if not lead_locator or lead_locator.lower() != locator_lower:
+                continue
+        if date_bounds is not None and not _in_date_range(lead.get("Days"), date_bounds):
+            continue
+        if status_key is not None and get_lead_status_key(lead) != status_key:
+            continue
+        result.append(lead)
     return result
 
 
@@ -1562,9 +1708,6 @@ def get_closing_ratio_by_month(leads: list[dict], months: int = 6) -> list[dict]
             ...
         ]
     """
-    from collections import defaultdict
-    from datetime import datetime, timedelta
-
     # Calculate cutoff date
     today = datetime.now(timezone.utc).date()
     cutoff_date = today - timedelta(days=months * 30)
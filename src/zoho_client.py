@@ -12,6 +12,7 @@ Responsibilities:
 import csv
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -29,9 +30,15 @@ from src.field_mapping import ZOHO_FIELD_MAP, map_zoho_lead
 from src.cache import (
     get_cached_stage_history,
     set_cached_stage_history,
+    get_cached_stage_histories_batch,
     set_cached_stage_histories_batch,
     get_cached_leads,
     set_cached_leads,
+    get_cached_notes,
+    set_cached_notes,
+    get_cached_deliveries,
+    set_cached_deliveries,
+    NO_NOTES_MARKER,
 )
 
 # Locator lookup cache (loaded from CSV)
@@ -44,6 +51,11 @@ OAUTH_TOKEN_URL = "https://accounts.zoho.com/oauth/v2/token"
 TOKEN_EXPIRY_BUFFER = 300  # Refresh 5 minutes before expiry
 MAX_RATE_LIMIT_RETRIES = 2  # Max retries on 429 rate limit
 DEFAULT_RETRY_AFTER = 60  # Default wait time if Retry-After header missing
+# Worker pools are module-level, so these limits are per server process and
+# shared by every browser session (all sessions use the same Zoho org credentials).
+# Together they stay within Zoho's recommended 10 concurrent requests.
+MAX_CONCURRENT_API_REQUESTS = 8  # Per-lead history/notes calls in flight, all sessions
+BACKGROUND_FETCH_WORKERS = 2  # One session's leads + deliveries fetches at once
 
 # Error types for UI differentiation (Story 1.6)
 ERROR_TYPE_CONNECTION = "connection"
@@ -127,6 +139,31 @@ def _clear_error() -> None:
     st.session_state.zoho_error_type = None
 
 
+def _report_request_error(
+    message: str,
+    error_type: str,
+    prefetched_token: Optional[str],
+    errors: Optional[list],
+) -> None:
+    """
+    Record a request failure where the caller can see it.
+
+    Worker threads can't touch session state: they either pass an errors
+    list to collect (message, error_type) for the main thread, or (with only
+    a prefetched token) drop the error.
+    """
+    if errors is not None:
+        errors.append((message, error_type))
+    elif not prefetched_token:
+        _set_error(message, error_type)
+
+
+def _invalidate_access_token() -> None:
+    """Drop the cached access token so the next request refreshes it."""
+    st.session_state.zoho_access_token = None
+    st.session_state.zoho_token_expiry = None
+
+
 def _get_credentials() -> dict:
     """
     Read Zoho credentials from Streamlit secrets.
@@ -288,6 +325,7 @@ def _make_request(
     retry_on_401: bool = True,
     _rate_limit_retries: int = 0,
     _prefetched_token: Optional[str] = None,
+    _errors: Optional[list] = None,
 ) -> Optional[requests.Response]:
     """
     Make an authenticated API request to Zoho CRM.
@@ -300,6 +338,8 @@ def _make_request(
         retry_on_401: Whether to retry with fresh token on 401
         _rate_limit_retries: Internal counter for rate limit retries (do not set)
         _prefetched_token: Pre-fetched access token (for use in worker threads)
+        _errors: List that collects (message, error_type) on failure instead of
+            session state (for worker threads whose caller reports the error)
 
     Returns:
         Response object if successful, None if failed.
@@ -341,8 +381,7 @@ def _make_request(
         if response.status_code == 401 and retry_on_401 and not _prefetched_token:
             logger.warning("Got 401, refreshing token and retrying")
             # Force token refresh and retry once
-            st.session_state.zoho_access_token = None
-            st.session_state.zoho_token_expiry = None
+            _invalidate_access_token()
             return _make_request(
                 method=method,
                 url=url,
@@ -352,6 +391,15 @@ def _make_request(
                 _rate_limit_retries=_rate_limit_retries,
             )
 
+        # Worker threads can't refresh the token; the collecting main thread does
+        if response.status_code == 401 and _errors is not None:
+            logger.warning("Got 401 in worker thread, deferring token refresh")
+            _errors.append((
+                "Session expired. Please refresh the page to reconnect.",
+                ERROR_TYPE_AUTH,
+            ))
+            return None
+
         # Handle 429 Rate Limit with backoff retry
         if response.status_code == 429:
             retry_after = _parse_retry_after(response.headers.get("Retry-After"))
@@ -373,28 +421,30 @@ def _make_request(
                     retry_on_401=retry_on_401,
                     _rate_limit_retries=_rate_limit_retries + 1,
                     _prefetched_token=_prefetched_token,
+                    _errors=_errors,
                 )
             else:
                 # Max retries exceeded
                 logger.error("Rate limit retries exhausted")
-                # Don't set error in session_state if using prefetched token (worker thread)
-                if not _prefetched_token:
-                    _set_error(
-                        "Too many requests to Zoho CRM. "
-                        "Rate limit exceeded after retries. Please try again later.",
-                        ERROR_TYPE_CONNECTION,
-                    )
+                _report_request_error(
+                    "Too many requests to Zoho CRM. "
+                    "Rate limit exceeded after retries. Please try again later.",
+                    ERROR_TYPE_CONNECTION,
+                    _prefetched_token,
+                    _errors,
+                )
                 return None
 
         # Handle other error status codes
         if response.status_code >= 400:
             logger.error("API error: HTTP %d", response.status_code)
-            if not _prefetched_token:
-                _set_error(
-                    f"Zoho CRM returned an error (status {response.status_code}). "
-                    "Please try again or contact support if the issue persists.",
-                    ERROR_TYPE_UNKNOWN,
-                )
+            _report_request_error(
+                f"Zoho CRM returned an error (status {response.status_code}). "
+                "Please try again or contact support if the issue persists.",
+                ERROR_TYPE_UNKNOWN,
+                _prefetched_token,
+                _errors,
+            )
             return None
 
         # Success - clear any previous errors (skip in worker threads)
@@ -404,29 +454,32 @@ def _make_request(
 
     except requests.exceptions.Timeout:
         logger.error("API request timed out after %ds", REQUEST_TIMEOUT)
-        if not _prefetched_token:
-            _set_error(
-                "Request timed out. Zoho may be slow. Please try again.",
-                ERROR_TYPE_TIMEOUT,
-            )
+        _report_request_error(
+            "Request timed out. Zoho may be slow. Please try again.",
+            ERROR_TYPE_TIMEOUT,
+            _prefetched_token,
+            _errors,
+        )
         return None
     except requests.exceptions.ConnectionError as e:
         logger.error("API connection error: %s", type(e).__name__)
-        if not _prefetched_token:
-            _set_error(
-                "Unable to connect to Zoho CRM. "
-                "Please check your connection and try again.",
-                ERROR_TYPE_CONNECTION,
-            )
+        _report_request_error(
+            "Unable to connect to Zoho CRM. "
+            "Please check your connection and try again.",
+            ERROR_TYPE_CONNECTION,
+            _prefetched_token,
+            _errors,
+        )
         return None
     except requests.exceptions.RequestException as e:
         logger.error("API request error: %s", type(e).__name__)
-        if not _prefetched_token:
-            _set_error(
-                "An error occurred while communicating with Zoho CRM. "
-                "Please try again.",
-                ERROR_TYPE_UNKNOWN,
-            )
+        _report_request_error(
+            "An error occurred while communicating with Zoho CRM. "
+            "Please try again.",
+            ERROR_TYPE_UNKNOWN,
+            _prefetched_token,
+            _errors,
+        )
         return None
 
 
@@ -531,7 +584,12 @@ def parse_zoho_date(date_string: Optional[str]) -> Optional[datetime]:
     if not date_string:
         return None
     try:
-        dt = dateutil_parser.parse(date_string)
+        # Zoho and our cache both emit ISO 8601, which fromisoformat parses far
+        # faster than dateutil; dateutil remains the fallback for anything else
+        try:
+            dt = datetime.fromisoformat(date_string.replace("Z", "+00:00"))
+        except ValueError:
+            dt = dateutil_parser.parse(date_string)
         # Handle naive datetime by assuming UTC
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
@@ -602,6 +660,43 @@ def _deserialize_leads_from_cache(leads: list[dict]) -> list[dict]:
     return deserialized
 
 
+# Use COQL to filter records with appointments server-side (efficient)
+# Note: COQL doesn't expand lookup fields, so Locator_Name returns ID only
+# Locator details are looked up from local CSV cache
+LEADS_COQL_QUERY = """
+    SELECT id, Name, APPT_Date, Stage, Locator_Name, Street_Address, Zip_Code, Created_Time, Modified_Time, Misc_Notes, Misc_Notes_Long
+    FROM Locatings
+    WHERE APPT_Date is not null
+    ORDER BY APPT_Date DESC
+    LIMIT 2000
+""".strip()
+
+# Process-wide pool for non-blocking lead and delivery fetches. A loading session
+# uses both workers (leads and deliveries overlap); another session loading at
+# the same time queues until a worker frees up, which its poll loop tolerates.
+_background_executor = ThreadPoolExecutor(max_workers=BACKGROUND_FETCH_WORKERS)
+
+# Process-wide pool for concurrent per-lead API calls (stage history, notes),
+# reused across reruns instead of spinning up threads per batch. Zoho's
+# concurrency and rate limits apply to the whole org, not per user, so the cap
+# is global on purpose: concurrent sessions share these workers and queue
+# behind each other rather than multiplying the load on the API.
+_api_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_API_REQUESTS)
+
+
+def get_cached_leads_with_appointments() -> list[dict] | None:
+    """
+    Get leads with appointments from the Supabase cache only.
+
+    Returns:
+        List of lead dictionaries with parsed dates, or None on a cache miss.
+    """
+    cached_leads = get_cached_leads()
+    if cached_leads is None:
+        return None
+    return _deserialize_leads_from_cache(cached_leads)
+
+
 def get_leads_with_appointments(bypass_cache: bool = False) -> list[dict]:
     """
     Fetch all leads with scheduled appointments from Zoho CRM.
@@ -631,27 +726,16 @@ def get_leads_with_appointments(bypass_cache: bool = False) -> list[dict]:
 
     # Check cache first (unless bypassed)
     if not bypass_cache:
-        cached_leads = get_cached_leads()
+        cached_leads = get_cached_leads_with_appointments()
         if cached_leads is not None:
-            return _deserialize_leads_from_cache(cached_leads)
+            return cached_leads
 
     logger.info("Fetching leads with appointments from API")
 
-    # Use COQL to filter records with appointments server-side (efficient)
-    # Note: COQL doesn't expand lookup fields, so Locator_Name returns ID only
-    # Locator details are looked up from local CSV cache
-    coql_query = """
-        SELECT id, Name, APPT_Date, Stage, Locator_Name, Street_Address, Zip_Code, Created_Time, Modified_Time, Misc_Notes, Misc_Notes_Long
-        FROM Locatings
-        WHERE APPT_Date is not null
-        ORDER BY APPT_Date DESC
-        LIMIT 2000
-    """.strip()
-
     url = f"{get_api_domain()}/crm/v8/coql"
 
     try:
-        response = _make_request("POST", url, json_data={"select_query": coql_query})
+        response = _make_request("POST", url, json_data={"select_query": LEADS_COQL_QUERY})
         if response is None:
             logger.warning("Failed to fetch leads (no response)")
             return []  # Error already captured in _make_request
@@ -677,6 +761,127 @@ def get_leads_with_appointments(bypass_cache: bool = False) -> list[dict]:
         return []
 
 
+def _fetch_leads_from_api(
+    _prefetched_token: str, _api_domain: str
+) -> tuple[list[dict] | None, tuple[str, str] | None]:
+    """
+    Fetch leads with appointments from the COQL API without touching session state.
+
+    Safe to run in a worker thread: credentials are passed in and neither
+    results nor errors are stored here (finish_background_leads_fetch does
+    both in the main thread).
+
+    Args:
+        _prefetched_token: Pre-fetched access token (avoids st.session_state in threads)
+        _api_domain: Pre-fetched API domain (avoids st.secrets in threads)
+
+    Returns:
+        Tuple of (leads, error). On failure leads is None and error is the
+        (message, ERROR_TYPE_*) pair get_leads_with_appointments() would set.
+    """
+    logger.info("Fetching leads with appointments from API (background)")
+
+    url = f"{_api_domain}/crm/v8/coql"
+    errors = []
+
+    try:
+        response = _make_request(
+            "POST", url,
+            json_data={"select_query": LEADS_COQL_QUERY},
+            _prefetched_token=_prefetched_token,
+            _errors=errors,
+        )
+        if response is None:
+            logger.warning("Failed to fetch leads (no response)")
+            return None, errors[-1]
+
+        data = response.json()
+        leads = [_map_and_parse_lead(lead) for lead in data.get("data", [])]
+        logger.info("Fetched %d leads with appointments from API", len(leads))
+        return leads, None
+
+    except JSONDecodeError:
+        logger.error("Invalid JSON response from Zoho CRM")
+        return None, ("Invalid response from Zoho CRM.", ERROR_TYPE_UNKNOWN)
+    except (KeyError, TypeError, AttributeError) as e:
+        logger.error("Error processing lead data: %s", type(e).__name__)
+        return None, (f"Error processing lead data: {type(e).__name__}", ERROR_TYPE_UNKNOWN)
+
+
+def start_background_leads_fetch() -> Future | None:
+    """
+    Submit a leads fetch to a worker thread so the caller doesn't block.
+
+    Credentials are resolved here in the main thread; the worker only
+    performs the COQL request. Collect the result with
+    finish_background_leads_fetch() once the future is done.
+
+    Returns:
+        Future resolving to a (leads, error) tuple, or None if no access
+        token is available (error is already set in session state).
+    """
+    _init_session_state()
+
+    prefetched_token = get_access_token()
+    if not prefetched_token:
+        return None
+
+    return _background_executor.submit(_fetch_leads_from_api, prefetched_token, get_api_domain())
+
+
+def _collect_background_fetch(future: Future, label: str) -> tuple[list[dict] | None, tuple[str, str] | None]:
+    """
+    Unpack a background fetch future into (records, error).
+
+    An exception raised by the worker itself is reported as a connection error.
+
+    Args:
+        future: Completed future from a start_background_*_fetch() call
+        label: What was fetched, for logging
+
+    Returns:
+        Tuple of (records, error) as returned by the worker.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error("Error in background %s fetch: %s", label, e)
+        return None, (
+            "Unable to connect to Zoho CRM. "
+            "Please check your connection and try again.",
+            ERROR_TYPE_CONNECTION,
+        )
+
+
+def finish_background_leads_fetch(future: Future) -> list[dict]:
+    """
+    Collect a completed background leads fetch in the main thread.
+
+    Caches successful results in Supabase and records the worker's error
+    otherwise, mirroring get_leads_with_appointments(). A 401 invalidates
+    the access token and refetches here, where the token can be refreshed.
+
+    Args:
+        future: Future returned by start_background_leads_fetch()
+
+    Returns:
+        List of lead dictionaries. Empty list if the fetch failed.
+    """
+    _init_session_state()
+
+    leads, error = _collect_background_fetch(future, "leads")
+
+    if leads is None:
+        if error[1] == ERROR_TYPE_AUTH:
+            _invalidate_access_token()
+            return get_leads_with_appointments(bypass_cache=True)
+        _set_error(*error)
+        return []
+
+    set_cached_leads(_serialize_leads_for_cache(leads))
+    return leads
+
+
 def get_stage_history(lead_id: str, current_stage: str = None) -> list[dict] | None:
     """
     Fetch stage transition history for a lead from Zoho CRM Timeline API.
@@ -809,7 +1014,7 @@ def get_stage_history(lead_id: str, current_stage: str = None) -> list[dict] | N
         return None  # Processing error
 
 
-def get_stage_histories_batch(leads: list[dict]) -> dict[str, list]:
+def get_stage_histories_batch(leads: list[dict], failed_ids: set | None = None) -> dict[str, list]:
     """
     Fetch stage history for multiple leads concurrently.
 
@@ -818,14 +1023,14 @@ def get_stage_histories_batch(leads: list[dict]) -> dict[str, list]:
 
     Args:
         leads: List of lead dicts with 'id' and 'Stage' keys
+        failed_ids: Optional set that receives the IDs of leads whose API
+            request was made and failed. Leads skipped without a request
+            (e.g. no access token) are not added.
 
     Returns:
         Dict mapping lead_id to stage history list.
         Missing/error leads are not included in the result.
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    from src.cache import get_cached_stage_histories_batch
-
     if not leads:
         return {}
 
@@ -880,40 +1085,35 @@ def get_stage_histories_batch(leads: list[dict]) -> dict[str, list]:
         logger.error("Cannot fetch stage history: no access token")
         return result
 
-    # Fetch uncached leads concurrently (max 10 concurrent to avoid rate limits)
+    # Fetch uncached leads concurrently on the shared worker pool
     # Note: Workers only fetch data - caching happens in main thread to avoid
     # Streamlit context issues with ThreadPoolExecutor
-    def fetch_single(lead, token, domain):
-        lead_id = lead.get("id")
-        current_stage = lead.get("Stage")
-        # Use internal fetch logic without cache check (we already checked)
-        # Pass prefetched credentials to avoid st.session_state/st.secrets access in threads
-        return lead_id, _fetch_stage_history_from_api(
-            lead_id, current_stage,
-            skip_cache=True,
-            _prefetched_token=token,
-            _api_domain=domain,
-        )
-
     to_cache = {}  # Collect results to cache in main thread (dict for batch upsert)
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(fetch_single, lead, prefetched_token, prefetched_domain) for lead in uncached_leads]
-        for future in as_completed(futures):
-            try:
-                lead_id, history = future.result()
-                if history is not None:
-                    result[lead_id] = history
-                    # Prepare cache data (convert datetime to ISO string)
-                    cache_data = []
-                    for t in history:
-                        cache_data.append({
-                            "from_stage": t["from_stage"],
-                            "to_stage": t["to_stage"],
-                            "changed_at": t["changed_at"].isoformat() if t["changed_at"] else None,
-                        })
-                    to_cache[lead_id] = cache_data
-            except Exception as e:
-                logger.error("Error in concurrent stage history fetch: %s", e)
+    futures = {
+        _api_executor.submit(_fetch_stage_history_for_lead, lead, prefetched_token, prefetched_domain): lead.get("id")
+        for lead in uncached_leads
+    }
+    for future in as_completed(futures):
+        try:
+            lead_id, history = future.result()
+            if history is None:
+                if failed_ids is not None:
+                    failed_ids.add(lead_id)
+            else:
+                result[lead_id] = history
+                # Prepare cache data (convert datetime to ISO string)
+                cache_data = []
+                for t in history:
+                    cache_data.append({
+                        "from_stage": t["from_stage"],
+                        "to_stage": t["to_stage"],
+                        "changed_at": t["changed_at"].isoformat() if t["changed_at"] else None,
+                    })
+                to_cache[lead_id] = cache_data
+        except Exception as e:
+            logger.error("Error in concurrent stage history fetch: %s", e)
+            if failed_ids is not None:
+                failed_ids.add(futures[future])
 
     # Batch cache all results in a single request (much faster than individual writes)
     if to_cache:
@@ -923,6 +1123,25 @@ def get_stage_histories_batch(leads: list[dict]) -> dict[str, list]:
     return result
 
 
+def _fetch_stage_history_for_lead(lead: dict, token: str, domain: str) -> tuple[str, list | None]:
+    """
+    Worker task for get_stage_histories_batch(): fetch one lead's history.
+
+    Uses the internal fetch logic without cache check (already checked) and
+    prefetched credentials to avoid st.session_state/st.secrets access in threads.
+
+    Returns:
+        Tuple of (lead_id, stage transitions or None on error)
+    """
+    lead_id = lead.get("id")
+    return lead_id, _fetch_stage_history_from_api(
+        lead_id, lead.get("Stage"),
+        skip_cache=True,
+        _prefetched_token=token,
+        _api_domain=domain,
+    )
+
+
 def _fetch_stage_history_from_api(
     lead_id: str,
     current_stage: str = None,
@@ -1031,8 +1250,6 @@ def get_notes_for_leads(lead_ids: list[str]) -> dict[str, dict]:
         Dict mapping lead_id to dict with 'content' and 'time' keys.
         Leads without notes will have empty content and None time.
     """
-    from src.cache import get_cached_notes, set_cached_notes, NO_NOTES_MARKER
-
     _init_session_state()
 
     if not lead_ids:
@@ -1058,32 +1275,28 @@ def get_notes_for_leads(lead_ids: list[str]) -> dict[str, dict]:
         logger.error("Cannot fetch notes: no access token")
         return cached_notes
 
-    # Fetch notes from API for uncached leads - use concurrent requests for speed
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
+    # Fetch notes from API for uncached leads - concurrent requests on the shared pool
     fresh_notes = {}
     notes_to_cache = {}
 
-    # Use thread pool for concurrent API calls (max 10 concurrent to avoid rate limits)
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_lead = {
-            executor.submit(_fetch_latest_note_for_lead, lead_id, prefetched_token, prefetched_domain): lead_id
-            for lead_id in uncached_ids
-        }
-        for future in as_completed(future_to_lead):
-            lead_id = future_to_lead[future]
-            try:
-                result = future.result()
-                if result:
-                    fresh_notes[lead_id] = {"content": result["content"], "time": result["time"]}
-                    notes_to_cache[lead_id] = {"content": result["content"], "time": result["time"]}
-                else:
-                    fresh_notes[lead_id] = {"content": "", "time": None}
-                    notes_to_cache[lead_id] = {"content": NO_NOTES_MARKER, "time": None}
-            except Exception as e:
-                logger.error("Error fetching note for lead %s: %s", lead_id, e)
+    future_to_lead = {
+        _api_executor.submit(_fetch_latest_note_for_lead, lead_id, prefetched_token, prefetched_domain): lead_id
+        for lead_id in uncached_ids
+    }
+    for future in as_completed(future_to_lead):
+        lead_id = future_to_lead[future]
+        try:
+            result = future.result()
+            if result:
+                fresh_notes[lead_id] = {"content": result["content"], "time": result["time"]}
+                notes_to_cache[lead_id] = {"content": result["content"], "time": result["time"]}
+            else:
                 fresh_notes[lead_id] = {"content": "", "time": None}
                 notes_to_cache[lead_id] = {"content": NO_NOTES_MARKER, "time": None}
+        except Exception as e:
+            logger.error("Error fetching note for lead %s: %s", lead_id, e)
+            fresh_notes[lead_id] = {"content": "", "time": None}
+            notes_to_cache[lead_id] = {"content": NO_NOTES_MARKER, "time": None}
 
     # Cache all results (including "no notes" markers)
     if notes_to_cache:
@@ -1171,6 +1384,38 @@ def _fetch_latest_note_for_lead(
         return None
 
 
+# Use COQL to fetch all deliveries
+# Note: Locatings lookup field returns ID only in COQL
+DELIVERIES_COQL_QUERY = """
+    SELECT id, Name, Locatings, Address, Zip_Code, Created_Time
+    FROM Deliveries
+    WHERE id is not null
+    ORDER BY Created_Time DESC
+    LIMIT 2000
+""".strip()
+
+
+def _map_deliveries(deliveries_data: list[dict]) -> list[dict]:
+    """Map raw Deliveries COQL records to delivery dictionaries."""
+    deliveries = []
+    for delivery in deliveries_data:
+        # Extract Locatings lookup (returns {id} or None)
+        locatings_lookup = delivery.get("Locatings")
+        locating_id = None
+        if isinstance(locatings_lookup, dict):
+            locating_id = locatings_lookup.get("id")
+
+        deliveries.append({
+            "id": delivery.get("id"),
+            "name": delivery.get("Name"),
+            "locating_id": locating_id,
+            "address": delivery.get("Address"),
+            "zip_code": delivery.get("Zip_Code"),
+            "created_time": delivery.get("Created_Time"),
+        })
+    return deliveries
+
+
 def get_deliveries(bypass_cache: bool = False) -> list[dict]:
     """
     Fetch all delivery records from Zoho CRM Deliveries module.
@@ -1189,8 +1434,6 @@ def get_deliveries(bypass_cache: bool = False) -> list[dict]:
             - locating_id: Linked Locating ID (if populated)
             - created_time: When delivery was created
     """
-    from src.cache import get_cached_deliveries, set_cached_deliveries
-
     _init_session_state()
 
     # Check cache first (unless bypassed)
@@ -1202,43 +1445,16 @@ def get_deliveries(bypass_cache: bool = False) -> list[dict]:
 
     logger.info("Fetching deliveries from API")
 
-    # Use COQL to fetch all deliveries
-    # Note: Locatings lookup field returns ID only in COQL
-    coql_query = """
-        SELECT id, Name, Locatings, Address, Zip_Code, Created_Time
-        FROM Deliveries
-        WHERE id is not null
-        ORDER BY Created_Time DESC
-        LIMIT 2000
-    """.strip()
-
     url = f"{get_api_domain()}/crm/v8/coql"
 
     try:
-        response = _make_request("POST", url, json_data={"select_query": coql_query})
+        response = _make_request("POST", url, json_data={"select_query": DELIVERIES_COQL_QUERY})
         if response is None:
             logger.warning("Failed to fetch deliveries (no response)")
             return []
 
         data = response.json()
-        deliveries_data = data.get("data", [])
-
-        deliveries = []
-        for delivery in deliveries_data:
-            # Extract Locatings lookup (returns {id} or None)
-            locatings_lookup = delivery.get("Locatings")
-            locating_id = None
-            if isinstance(locatings_lookup, dict):
-                locating_id = locatings_lookup.get("id")
-
-            deliveries.append({
-                "id": delivery.get("id"),
-                "name": delivery.get("Name"),
-                "locating_id": locating_id,
-                "address": delivery.get("Address"),
-                "zip_code": delivery.get("Zip_Code"),
-                "created_time": delivery.get("Created_Time"),
-            })
+        deliveries = _map_deliveries(data.get("data", []))
 
         logger.info("Fetched %d deliveries from API", len(deliveries))
 
@@ -1255,3 +1471,97 @@ def get_deliveries(bypass_cache: bool = False) -> list[dict]:
         logger.error("Error processing delivery data: %s", type(e).__name__)
         _set_error(f"Error processing delivery data: {type(e).__name__}", ERROR_TYPE_UNKNOWN)
         return []
+
+
+def _fetch_deliveries_from_api(
+    _prefetched_token: str, _api_domain: str
+) -> tuple[list[dict] | None, tuple[str, str] | None]:
+    """
+    Fetch deliveries from the COQL API without touching session state.
+
+    Safe to run in a worker thread, like _fetch_leads_from_api().
+
+    Args:
+        _prefetched_token: Pre-fetched access token (avoids st.session_state in threads)
+        _api_domain: Pre-fetched API domain (avoids st.secrets in threads)
+
+    Returns:
+        Tuple of (deliveries, error). On failure deliveries is None and error
+        is the (message, ERROR_TYPE_*) pair get_deliveries() would set.
+    """
+    logger.info("Fetching deliveries from API (background)")
+
+    url = f"{_api_domain}/crm/v8/coql"
+    errors = []
+
+    try:
+        response = _make_request(
+            "POST", url,
+            json_data={"select_query": DELIVERIES_COQL_QUERY},
+            _prefetched_token=_prefetched_token,
+            _errors=errors,
+        )
+        if response is None:
+            logger.warning("Failed to fetch deliveries (no response)")
+            return None, errors[-1]
+
+        data = response.json()
+        deliveries = _map_deliveries(data.get("data", []))
+        logger.info("Fetched %d deliveries from API", len(deliveries))
+        return deliveries, None
+
+    except JSONDecodeError:
+        logger.error("Invalid JSON response from Zoho CRM for deliveries")
+        return None, ("Invalid response from Zoho CRM.", ERROR_TYPE_UNKNOWN)
+    except (KeyError, TypeError, AttributeError) as e:
+        logger.error("Error processing delivery data: %s", type(e).__name__)
+        return None, (f"Error processing delivery data: {type(e).__name__}", ERROR_TYPE_UNKNOWN)
+
+
+def start_background_deliveries_fetch() -> Future | None:
+    """
+    Submit a deliveries fetch to a worker thread so it overlaps the leads fetch.
+
+    Credentials are resolved here in the main thread. Collect the result with
+    finish_background_deliveries_fetch() once the future is done.
+
+    Returns:
+        Future resolving to a (deliveries, error) tuple, or None if no access
+        token is available (error is already set in session state).
+    """
+    _init_session_state()
+
+    prefetched_token = get_access_token()
+    if not prefetched_token:
+        return None
+
+    return _background_executor.submit(_fetch_deliveries_from_api, prefetched_token, get_api_domain())
+
+
+def finish_background_deliveries_fetch(future: Future) -> list[dict]:
+    """
+    Collect a completed background deliveries fetch in the main thread.
+
+    Caches successful results in Supabase and records the worker's error
+    otherwise, mirroring get_deliveries(). A 401 invalidates the access
+    token and refetches here, where the token can be refreshed.
+
+    Args:
+        future: Future returned by start_background_deliveries_fetch()
+
+    Returns:
+        List of delivery dictionaries. Empty list if the fetch failed.
+    """
+    _init_session_state()
+
+    deliveries, error = _collect_background_fetch(future, "deliveries")
+
+    if deliveries is None:
+        if error[1] == ERROR_TYPE_AUTH:
+            _invalidate_access_token()
+            return get_deliveries(bypass_cache=True)
+        _set_error(*error)
+        return []
+
+    set_cached_deliveries(deliveries)
+    return deliveries
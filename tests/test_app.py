@@ -0,0 +1,215 @@
+"""
+Tests for the dashboard page in app.py.
+
+Runs the real script through Streamlit's AppTest harness with Zoho HTTP calls
+faked at zoho_client._make_request and Supabase caching disabled.
+"""
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+pytest.importorskip("streamlit_scroll_to_top")
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+from src import cache, zoho_client
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / "app.py")
+
+# test_zoho_client replaces sys.modules["streamlit"] with a mock at import time;
+# keep a handle on the real module so the app script can import it.
+_STREAMLIT = streamlit
+
+
+def _zoho_records(
+    days_ago: list[int],
+    modified_days_ago: list[int] | None = None,
+    stages: list[str] | None = None,
+) -> list[dict]:
+    """Build raw Zoho lead records with appointments the given days in the past."""
+    now = datetime.now(timezone.utc)
+    modified_days_ago = modified_days_ago or [0] * len(days_ago)
+    stages = stages or ["Appt Set"] * len(days_ago)
+    return [
+        {
+            "id": str(1000 + i),
+            "Name": f"Lead {i}",
+            "APPT_Date": (now - timedelta(days=days)).isoformat(),
+            "Stage": stage,
+            "Locator_Name": None,
+            "Modified_Time": (now - timedelta(days=modified)).isoformat(),
+        }
+        for i, (days, modified, stage) in enumerate(zip(days_ago, modified_days_ago, stages))
+    ]
+
+
+@pytest.fixture
+def zoho_records():
+    """Fake Zoho API serving the returned list as the lead COQL result."""
+    records = []
+
+    def fake_request(method, url, params=None, json_data=None, _prefetched_token=None, **kwargs):
+        response = Mock()
+        response.status_code = 200
+        if url.endswith("/coql") and json_data["select_query"] == zoho_client.LEADS_COQL_QUERY:
+            response.json.return_value = {"data": records}
+        else:
+            response.json.return_value = {"data": []}
+        return response
+
+    with patch.dict(cache._list_memo, clear=True), \
+            patch.object(cache, "_get_supabase_client", return_value=None), \
+            patch.object(zoho_client, "_make_request", side_effect=fake_request), \
+            patch.object(zoho_client, "get_access_token", return_value="test-token"), \
+            patch.object(zoho_client, "get_api_domain", return_value="https://www.zohoapis.com"):
+        mocked_streamlit = sys.modules.get("streamlit")
+        sys.modules["streamlit"] = _STREAMLIT
+        try:
+            yield records
+        finally:
+            sys.modules["streamlit"] = mocked_streamlit
+
+
+def _load_dashboard(at: AppTest) -> AppTest:
+    """Run the app until the background lead fetch has been collected."""
+    at.run()
+    for _ in range(50):
+        if not any("Loading leads" in caption.value for caption in at.caption):
+            break
+        at.run()
+    assert not at.exception
+    return at
+
+
+def _chart_titles(at: AppTest) -> list[str]:
+    """Titles of the Plotly charts currently on the page."""
+    return [
+        json.loads(chart.proto.spec)["layout"].get("title", {}).get("text")
+        for chart in at.get("plotly_chart")
+    ]
+
+
+class TestScrollToLead:
+    """Tests for navigating to a lead card via the scroll_to query param."""
+
+    def test_details_can_be_closed_after_navigation(self, zoho_records):
+        """The target card opens once; closing it sticks across later reruns."""
+        zoho_records.extend(_zoho_records([1, 2, 3]))
+        at = _load_dashboard(AppTest.from_file(APP_PATH, default_timeout=30))
+        target_key = "expanded_1001"
+
+        at.query_params["scroll_to"] = "1001"
+        at.run()
+        assert at.session_state[target_key] is True
+
+        at.toggle(key=target_key).set_value(False).run()
+        assert at.session_state[target_key] is False
+
+        # Unrelated full rerun (filter change) must not reopen the card
+        at.selectbox(key="sort_option").set_value(at.selectbox(key="sort_option").options[-1]).run()
+        assert at.session_state[target_key] is False
+        assert not at.exception
+
+
+class TestLeadCards:
+    """Tests for rendering the lead cards."""
+
+    def test_leads_without_id_render(self, zoho_records):
+        """Several leads without an ID don't collide on a widget key."""
+        zoho_records.extend(_zoho_records([1, 2, 3]))
+        zoho_records[0]["id"] = zoho_records[1]["id"] = None
+        at = _load_dashboard(AppTest.from_file(APP_PATH, default_timeout=30))
+
+        assert [t.key for t in at.toggle if t.key.startswith("expanded_")] == ["expanded_1002"]
+        assert len(at.expander) >= 3
+
+
+class TestLeadNavigation:
+    """Tests for lead links that target a card on another page."""
+
+    def test_off_page_lead_opens_in_same_session(self, zoho_records):
+        """The navigation input jumps to the lead's page without a reload."""
+        zoho_records.extend(_zoho_records(list(range(1, 61))))
+        at = _load_dashboard(AppTest.from_file(APP_PATH, default_timeout=30))
+        at.selectbox(key="filter_date_range").set_value("All Dates").run()
+        assert "expanded_1055" not in [t.key for t in at.toggle]
+
+        at.text_input(key="_lead_nav_request").input("1055").run()
+
+        assert at.session_state.leads_page == 1
+        assert at.session_state["expanded_1055"] is True
+        assert at.text_input(key="_lead_nav_request").value == ""
+        # The target is consumed, so paging away is not undone on later reruns
+        assert "scroll_to_lead" not in at.session_state
+        at.button(key="leads_page_prev_top").click().run()
+        assert at.session_state.leads_page == 0
+        assert not at.exception
+
+
+class TestSortOrder:
+    """Tests for lead card order under the sort options."""
+
+    def test_sort_ties_keep_appointment_order(self, zoho_records):
+        """Leads tied on the sort key stay in appointment order, not last-activity order."""
+        # Appointment order 1000, 1001, 1002; last activity reverses it
+        zoho_records.extend(_zoho_records([1, 2, 3], modified_days_ago=[9, 5, 1]))
+        at = _load_dashboard(AppTest.from_file(APP_PATH, default_timeout=30))
+
+        at.selectbox(key="sort_option").set_value("Stage (A-Z)").run()
+
+        card_ids = [t.key.removeprefix("expanded_") for t in at.toggle if t.key.startswith("expanded_")]
+        assert card_ids == ["1000", "1001", "1002"]
+
+    def test_sort_does_not_reorder_filtered_aggregates(self, zoho_records):
+        """Stage rows tied on count keep the same order under every sort option."""
+        # The 200-day-old lead falls outside the default date range, so the view is filtered
+        zoho_records.extend(_zoho_records(
+            [1, 2, 3, 200], stages=["Green", "HLM Follow up", "Appt Set", "Appt Set"]
+        ))
+        at = _load_dashboard(AppTest.from_file(APP_PATH, default_timeout=30))
+        stage_order = at.session_state["_filtered_view_data"]["aggregates"]["stage_counts"]["stage"]
+
+        at.selectbox(key="sort_option").set_value("Stage (A-Z)").run()
+
+        view = at.session_state["_filtered_view_data"]
+        assert len(view["leads"]) == 3
+        assert view["aggregates"]["stage_counts"]["stage"] == stage_order
+
+
+class TestAppointmentsTimeline:
+    """Tests for week/month binning of the appointments timeline."""
+
+    def _timeline_title(self, at: AppTest) -> str:
+        at.selectbox(key="filter_date_range").set_value("All Dates").run()
+        at.radio(key="chart_section").set_value("Status & Timeline").run()
+        return next(t for t in _chart_titles(at) if t and t.startswith("Appointments by"))
+
+    def test_sparse_long_range_bins_by_month(self, zoho_records):
+        """Few appointments spread over two years still bin by month."""
+        zoho_records.extend(_zoho_records([700, 350, 10]))
+        at = _load_dashboard(AppTest.from_file(APP_PATH, default_timeout=30))
+
+        assert self._timeline_title(at) == "Appointments by Month"
+
+    def test_sort_change_reuses_figure(self, zoho_records):
+        """Changing only the sort option doesn't rebuild the timeline figure."""
+        zoho_records.extend(_zoho_records([30, 10, 3]))
+        at = _load_dashboard(AppTest.from_file(APP_PATH, default_timeout=30))
+        self._timeline_title(at)
+        fig = at.session_state["_timeline_fig_data"]
+
+        at.selectbox(key="sort_option").set_value("Stage (A-Z)").run()
+
+        assert at.session_state["_timeline_fig_data"] is fig
+
+    def test_short_range_bins_by_week(self, zoho_records):
+        """Appointments within a few weeks bin by week."""
+        zoho_records.extend(_zoho_records([30, 10, 3]))
+        at = _load_dashboard(AppTest.from_file(APP_PATH, default_timeout=30))
+
+        assert self._timeline_title(at) == "Appointments by Week"
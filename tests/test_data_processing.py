@@ -10,6 +10,7 @@ from src.data_processing import (
     format_status_display,
     get_status_emoji,
     format_date,
+    format_date_numeric,
     safe_display,
     format_leads_for_display,
     format_last_updated,
@@ -21,9 +22,16 @@ from src.data_processing import (
     sort_by_urgency,
     sort_leads,
     count_leads_by_status,
+    get_lead_status_key,
+    get_lead_status_emoji,
+    bucket_leads_by_status,
+    count_leads_by_stage,
+    get_locator_workload,
+    compute_status_aggregates,
     filter_by_stage,
     filter_by_locator,
     filter_by_date_range,
+    filter_by_status,
     apply_filters,
     get_unique_stages,
     get_unique_locators,
@@ -154,6 +162,19 @@ class TestFormatDate:
         result = format_date(dt)
         assert result == "Mar 5, 2026"
 
+
+class TestFormatDateNumeric:
+    """Tests for format_date_numeric function."""
+
+    def test_formats_with_zero_padding(self):
+        """Formats datetime as 'MM.DD.YYYY' with zero-padded month and day."""
+        dt = datetime(2026, 3, 5, 10, 30, 0, tzinfo=timezone.utc)
+        assert format_date_numeric(dt) == "03.05.2026"
+
+    def test_returns_dash_for_none(self):
+        """Returns '—' for None input."""
+        assert format_date_numeric(None) == "—"
+
     def test_formats_double_digit_day(self):
         """Double digit days display correctly."""
         dt = datetime(2026, 6, 15, 0, 0, 0, tzinfo=timezone.utc)
@@ -203,6 +224,7 @@ class TestFormatLeadsForDisplay:
         assert len(result) == 1
         assert result[0]["Lead Name"] == "John Smith"
         assert result[0]["Appointment Date"] == "Jan 7, 2026"
+        assert result[0]["appointment_date_numeric"] == "01.07.2026"
         assert result[0]["Stage"] == "Appt Set"
         assert result[0]["Locator"] == "Marcus Johnson"
 
@@ -225,11 +247,36 @@ class TestFormatLeadsForDisplay:
         assert result[0]["Stage"] == "—"
         assert result[0]["Locator"] == "—"
 
+    def test_stage_and_locator_strings_are_shared(self):
+        """Equal stage and locator values are the same string object across leads."""
+        leads = [
+            {"id": str(i), "current_stage": "".join(["Appt", " Set"]), "locator_name": "".join(["Ma", "rcus"])}
+            for i in range(2)
+        ]
+
+        result = format_leads_for_display(leads)
+
+        assert result[0]["Stage"] is result[1]["Stage"]
+        assert result[0]["Locator"] is result[1]["Locator"]
+
     def test_handles_empty_list(self):
         """Returns empty list for empty input."""
         result = format_leads_for_display([])
         assert result == []
 
+    def test_includes_status_key(self):
+        """Each row carries the canonical status key; no status counts as healthy."""
+        leads = [
+            {"id": "1", "appointment_date": datetime.now(timezone.utc) - timedelta(days=20)},
+            {"id": "2", "appointment_date": None},
+        ]
+
+        result = format_leads_for_display(leads)
+
+        assert result[0]["status_key"] == "stale"
+        assert result[0]["Status"] == "🔴 stale"
+        assert result[1]["status_key"] == "healthy"
+
     def test_handles_multiple_leads(self):
         """Correctly formats multiple leads."""
         leads = [
@@ -267,7 +314,8 @@ class TestFormatLeadsForDisplay:
         # Should have display columns including id (Story 4.2), Days, Status (Story 2.1, 2.2),
         # contact links (Story 1.7), zoho_link, classification_reason (v2), and misc_notes fields
         expected_keys = {
-            "id", "Lead Name", "Appointment Date", "Days", "Status", "Stage",
+            "id", "Lead Name", "Appointment Date", "appointment_date_numeric", "Days",
+            "Status", "status_key", "Stage",
             "Locator", "Phone", "Email", "zoho_link", "classification_reason",
             "misc_notes", "misc_notes_long"
         }
@@ -887,6 +935,17 @@ class TestSortByUrgency:
         # Result is different order
         assert result[0]["Lead Name"] == "Stale"
 
+    def test_uses_precomputed_status_key(self):
+        """Ranks by status_key when present rather than the Status string."""
+        leads = [
+            {"Status": "🔴 stale", "status_key": "healthy", "Days": 10, "Lead Name": "Healthy"},
+            {"Status": "🟢 healthy", "status_key": "at_risk", "Days": 2, "Lead Name": "At Risk"},
+        ]
+
+        result = sort_by_urgency(leads)
+
+        assert [lead["Lead Name"] for lead in result] == ["At Risk", "Healthy"]
+
 
 class TestCountLeadsByStatus:
     """Tests for count_leads_by_status function (Story 2.6)."""
@@ -965,6 +1024,18 @@ class TestCountLeadsByStatus:
         assert "at_risk" in result
         assert "healthy" in result
 
+    def test_count_uses_precomputed_status_key(self):
+        """Precomputed status_key is used instead of parsing Status."""
+        leads = [
+            {"Status": "🔴 stale", "status_key": "stale"},
+            {"Status": "🟠 needs_attention", "status_key": "needs_attention"},
+            {"status_key": "at_risk"},
+        ]
+
+        result = count_leads_by_status(leads)
+
+        assert result == {"stale": 1, "at_risk": 1, "needs_attention": 1, "healthy": 0}
+
     def test_count_handles_empty_string_status(self):
         """Leads with empty string status are counted as healthy."""
         leads = [
@@ -994,6 +1065,145 @@ class TestCountLeadsByStatus:
         assert total == len(leads)
 
 
+
+class TestGetLeadStatusKey:
+    """Tests for get_lead_status_key function."""
+
+    def test_prefers_precomputed_key(self):
+        """Returns status_key without looking at Status."""
+        assert get_lead_status_key({"Status": "🔴 stale", "status_key": "at_risk"}) == "at_risk"
+
+    def test_falls_back_to_status_string(self):
+        """Parses the formatted Status string when status_key is missing."""
+        assert get_lead_status_key({"Status": "🟠 needs_attention"}) == "needs_attention"
+
+    def test_missing_status_is_healthy(self):
+        """Leads without any status information count as healthy."""
+        assert get_lead_status_key({}) == "healthy"
+
+
+class TestGetLeadStatusEmoji:
+    """Tests for get_lead_status_emoji function."""
+
+    def test_uses_precomputed_key(self):
+        """Leads with a status get the emoji for their status key."""
+        assert get_lead_status_emoji({"Status": "🔴 stale", "status_key": "stale"}) == "🔴"
+
+    def test_lead_without_status_has_no_emoji(self):
+        """Leads without a status (no appointment date) get no indicator, not healthy's."""
+        assert get_lead_status_emoji({"Status": None, "status_key": "healthy"}) == ""
+
+
+class TestBucketLeadsByStatus:
+    """Tests for bucket_leads_by_status function."""
+
+    def test_groups_leads_preserving_order(self):
+        """Each bucket holds its leads in input order."""
+        leads = [
+            {"id": "1", "status_key": "at_risk"},
+            {"id": "2", "status_key": "stale"},
+            {"id": "3", "status_key": "at_risk"},
+            {"id": "4", "Status": "🟠 needs_attention"},
+        ]
+
+        result = bucket_leads_by_status(leads)
+
+        assert [lead["id"] for lead in result["at_risk"]] == ["1", "3"]
+        assert [lead["id"] for lead in result["stale"]] == ["2"]
+        assert [lead["id"] for lead in result["needs_attention"]] == ["4"]
+        assert result["healthy"] == []
+
+    def test_bucket_sizes_match_counts(self):
+        """Bucket sizes agree with count_leads_by_status."""
+        leads = [
+            {"Status": "🔴 stale"},
+            {"Status": "🟢 healthy"},
+            {"Status": None},
+            {"Status": "🟡 at_risk"},
+        ]
+
+        result = bucket_leads_by_status(leads)
+
+        assert {key: len(group) for key, group in result.items()} == count_leads_by_status(leads)
+
+
+class TestComputeStatusAggregates:
+    """Tests for compute_status_aggregates function."""
+
+    LEADS = [
+        {"Stage": "Appt Set", "Locator": "Ann", "status_key": "stale"},
+        {"Stage": "Appt Set", "Locator": "Bob", "status_key": "at_risk"},
+        {"Stage": "Green", "Locator": "Ann", "status_key": "healthy"},
+        {"Stage": "—", "Locator": None, "Status": "🟠 needs_attention"},
+        {"Stage": "Appt Set", "Locator": "Bob", "status_key": "stale"},
+    ]
+
+    @staticmethod
+    def _rows(columns: dict[str, list]) -> list[dict]:
+        """Transpose column lists back into row dicts."""
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def test_matches_individual_aggregations(self):
+        """Single pass agrees with the separate count/workload functions."""
+        result = compute_status_aggregates(self.LEADS)
+
+        assert result["status_counts"] == count_leads_by_status(self.LEADS)
+        assert self._rows(result["stage_counts"]) == count_leads_by_stage(self.LEADS)
+        assert self._rows(result["locator_workload"]) == get_locator_workload(self.LEADS)
+
+    def test_returns_columns(self):
+        """Stage and locator tables are dicts of equal-length column lists."""
+        result = compute_status_aggregates(self.LEADS)
+
+        assert result["stage_counts"]["stage"] == ["Appt Set", "Green", "Unknown"]
+        assert result["stage_counts"]["stale"] == [2, 0, 0]
+        assert result["locator_workload"]["locator"] == ["Bob", "Ann", "Unknown"]
+        assert result["locator_workload"]["total"] == [2, 2, 1]
+
+    def test_placeholder_stage_and_locator_grouped_as_unknown(self):
+        """Missing or placeholder values are grouped under 'Unknown'."""
+        result = compute_status_aggregates(self.LEADS)
+
+        unknown_stage = next(row for row in self._rows(result["stage_counts"]) if row["stage"] == "Unknown")
+        unknown_locator = next(
+            row for row in self._rows(result["locator_workload"]) if row["locator"] == "Unknown"
+        )
+        assert unknown_stage["needs_attention"] == 1
+        assert unknown_locator["total"] == 1
+
+    def test_appointment_days_skip_leads_without_days(self):
+        """Timeline columns pair each lead's Days with its status, skipping missing days."""
+        leads = [
+            {"Days": -3, "status_key": "at_risk"},
+            {"Days": None, "status_key": "healthy"},
+            {"Days": 12, "status_key": "stale"},
+        ]
+        result = compute_status_aggregates(leads)
+
+        assert result["appointment_days"] == {"days": [-3, 12], "status_key": ["at_risk", "stale"]}
+
+    def test_ties_keep_first_seen_order(self):
+        """Rows with equal sort keys stay in the order they were first seen."""
+        leads = [
+            {"Stage": "Green", "Locator": "Cy", "status_key": "healthy"},
+            {"Stage": "Appt Set", "Locator": "Ann", "status_key": "healthy"},
+            {"Stage": "Quote", "Locator": "Bob", "status_key": "healthy"},
+        ]
+        result = compute_status_aggregates(leads)
+
+        assert result["stage_counts"]["stage"] == ["Green", "Appt Set", "Quote"]
+        assert result["locator_workload"]["locator"] == ["Cy", "Ann", "Bob"]
+
+    def test_empty_leads(self):
+        """Empty input yields zero counts and empty columns."""
+        result = compute_status_aggregates([])
+
+        assert result["status_counts"] == {"stale": 0, "at_risk": 0, "needs_attention": 0, "healthy": 0}
+        assert result["stage_counts"]["stage"] == []
+        assert result["locator_workload"]["locator"] == []
+        assert result["appointment_days"] == {"days": [], "status_key": []}
+
+
 class TestFilterByStage:
     """Tests for filter_by_stage function (Story 3.1)."""
 
@@ -1215,6 +1425,23 @@ class TestFilterByDateRange:
         assert len(result) == 1
         assert result[0]["Lead Name"] == "Has Date"
 
+    def test_preset_boundaries_are_inclusive(self):
+        """Each preset includes its last day and excludes the day after."""
+        leads = [{"Days": days} for days in (-1, 0, 6, 7, 29, 30, 89, 90, 182, 183)]
+
+        def kept(date_range):
+            return [lead["Days"] for lead in filter_by_date_range(leads, date_range)]
+
+        assert kept("Future") == [-1]
+        assert kept("Last 7 Days + Future") == [-1, 0, 6]
+        assert kept("Last 30 Days + Future") == [-1, 0, 6, 7, 29]
+        assert kept("Last 90 Days + Future") == [-1, 0, 6, 7, 29, 30, 89]
+        assert kept("Last 6 Months") == [0, 6, 7, 29, 30, 89, 90, 182]
+
+    def test_unknown_preset_matches_nothing(self):
+        """An unrecognised preset filters out every lead."""
+        assert filter_by_date_range([{"Days": 0}, {"Days": -3}], "Next Year") == []
+
 
 class TestApplyFilters:
     """Tests for apply_filters function (Story 3.1)."""
@@ -1246,6 +1473,14 @@ class TestApplyFilters:
 
         assert len(result) == 2
 
+    def test_apply_filters_all_defaults_returns_input_list(self):
+        """All-default filters short-circuit and return the same list object."""
+        leads = [{"Stage": "Appt Set", "Locator": "Marcus", "Days": None}]
+
+        result = apply_filters(leads)
+
+        assert result is leads
+
     def test_apply_filters_empty_result(self):
         """Apply filters that match nothing returns empty list (AC#12)."""
         leads = [
@@ -1256,6 +1491,29 @@ class TestApplyFilters:
 
         assert result == []
 
+    def test_apply_filters_matches_individual_filters(self):
+        """Single pass gives the same leads, in order, as chaining each filter."""
+        leads = [
+            {"Stage": "Appt Set", "Locator": "marcus", "Days": -2, "status_key": "at_risk"},
+            {"Stage": "Appt Set", "Locator": "Marcus", "Days": 20, "status_key": "at_risk"},
+            {"Stage": "Appt Set", "Locator": None, "Days": 1, "status_key": "at_risk"},
+            {"Stage": "Appt Set", "Locator": "Marcus", "Days": None, "status_key": "at_risk"},
+            {"Stage": "Appt Set", "Locator": "Marcus", "Days": 5, "status_key": "stale"},
+            {"Stage": "Appt Set", "Locator": "MARCUS", "Days": 0, "status_key": "at_risk"},
+        ]
+
+        result = apply_filters(leads, "Appt Set", "Marcus", "Last 7 Days + Future", "At Risk")
+
+        expected = filter_by_status(
+            filter_by_date_range(
+                filter_by_locator(filter_by_stage(leads, "Appt Set"), "Marcus"),
+                "Last 7 Days + Future",
+            ),
+            "At Risk",
+        )
+        assert result == expected
+        assert [lead["Days"] for lead in result] == [-2, 0]
+
 
 class TestGetUniqueStages:
     """Tests for get_unique_stages helper function."""
@@ -1552,6 +1810,23 @@ class TestSortLeads:
         assert result[1]["Lead Name"] == "Bob"
         assert result[2]["Lead Name"] == "John"
 
+    def test_sort_then_filter_matches_filter_then_sort(self):
+        """Sorting all leads once and filtering gives the same order as sorting the filtered leads."""
+        leads = [
+            {"id": str(i), "Stage": stage, "Locator": "Marcus", "Days": days,
+             "Lead Name": name, "status_key": "healthy", "days_since_activity": days}
+            for i, (stage, days, name) in enumerate([
+                ("Appt Set", 3, "Cara"), ("HLM Follow up", 3, "Abe"),
+                ("Appt Set", None, "Bob"), ("Appt Set", 7, "Abe"),
+                ("HLM Follow up", 1, "Dan"), ("Appt Set", 3, "Abe"),
+            ])
+        ]
+
+        for option in SORT_OPTIONS:
+            expected = sort_leads(apply_filters(leads, stage="Appt Set"), option)
+            result = apply_filters(sort_leads(leads, option), stage="Appt Set")
+            assert [lead["id"] for lead in result] == [lead["id"] for lead in expected]
+
     def test_sort_preserves_data_integrity(self):
         """Sort returns new list without modifying original."""
         original = [
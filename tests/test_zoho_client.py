@@ -450,6 +450,11 @@ class TestConstants:
         """Verify DEFAULT_RETRY_AFTER constant."""
         assert zoho_client.DEFAULT_RETRY_AFTER == 60
 
+    def test_worker_pools_sized_from_limits(self):
+        """Shared worker pools use the documented process-wide limits."""
+        assert zoho_client._api_executor._max_workers == zoho_client.MAX_CONCURRENT_API_REQUESTS
+        assert zoho_client._background_executor._max_workers == zoho_client.BACKGROUND_FETCH_WORKERS
+
 
 class TestParseZohoDate:
     """Tests for parse_zoho_date function."""
@@ -473,6 +478,12 @@ class TestParseZohoDate:
         assert result.hour == 10
         assert result.minute == 30
 
+    def test_parse_iso_date_z_suffix(self):
+        """Parse ISO 8601 date with a Z (UTC) suffix."""
+        result = zoho_client.parse_zoho_date("2026-01-07T10:30:00Z")
+
+        assert result == datetime(2026, 1, 7, 10, 30, tzinfo=timezone.utc)
+
     def test_parse_returns_none_for_empty_string(self):
         """Empty string returns None."""
         assert zoho_client.parse_zoho_date("") is None
@@ -775,6 +786,150 @@ class TestGetLeadsWithAppointments:
         assert "AttributeError" in mock_st.session_state.zoho_error
 
 
+class TestBackgroundLeadsFetch:
+    """Tests for the non-blocking leads fetch used on initial page load."""
+
+    def test_fetch_from_api_with_prefetched_token(self, mock_st, mock_requests):
+        """Worker fetch uses the prefetched token and maps leads."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "data": [{"id": "123", "Name": "Test Lead", "Stage": "Appt Set"}]
+        }
+        mock_requests.request.return_value = mock_response
+
+        leads, error = zoho_client._fetch_leads_from_api("worker-token", "https://www.zohoapis.com")
+
+        assert error is None
+        assert len(leads) == 1
+        assert leads[0]["id"] == "123"
+        headers = mock_requests.request.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Zoho-oauthtoken worker-token"
+
+    def test_fetch_from_api_returns_error_on_failure(self, mock_st, mock_requests):
+        """Worker fetch returns the typed error and leaves session error state untouched."""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_requests.request.return_value = mock_response
+
+        leads, error = zoho_client._fetch_leads_from_api("worker-token", "https://www.zohoapis.com")
+
+        assert leads is None
+        assert error[1] == zoho_client.ERROR_TYPE_UNKNOWN
+        assert "zoho_error" not in mock_st.session_state
+
+    def test_start_returns_none_without_token(self, mock_st, mock_requests):
+        """No future is started when authentication fails."""
+        mock_response = Mock()
+        mock_response.status_code = 401
+        mock_requests.post.return_value = mock_response
+
+        assert zoho_client.start_background_leads_fetch() is None
+
+    def test_background_fetch_round_trip(self, mock_st, mock_requests):
+        """Started fetch resolves and is collected in the main thread."""
+        mock_st.session_state.zoho_access_token = "valid-token"
+        mock_st.session_state.zoho_token_expiry = (
+            datetime.now(timezone.utc).timestamp() + 3600
+        )
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": [{"id": "1"}, {"id": "2"}]}
+        mock_requests.request.return_value = mock_response
+
+        future = zoho_client.start_background_leads_fetch()
+        leads = zoho_client.finish_background_leads_fetch(future)
+
+        assert [lead["id"] for lead in leads] == ["1", "2"]
+
+    def test_finish_sets_error_on_failure(self, mock_st):
+        """Failed background fetch returns empty list and records an error."""
+        future = Mock()
+        future.result.side_effect = RuntimeError("worker crashed")
+
+        leads = zoho_client.finish_background_leads_fetch(future)
+
+        assert leads == []
+        assert mock_st.session_state.zoho_error_type == zoho_client.ERROR_TYPE_CONNECTION
+
+    def test_background_timeout_records_timeout_error(self, mock_st, mock_requests):
+        """A timeout in the worker surfaces as a timeout error, not a generic one."""
+        import requests as real_requests
+        mock_st.session_state.zoho_access_token = "valid-token"
+        mock_st.session_state.zoho_token_expiry = (
+            datetime.now(timezone.utc).timestamp() + 3600
+        )
+        mock_requests.request.side_effect = real_requests.exceptions.Timeout()
+        mock_requests.exceptions = real_requests.exceptions
+
+        future = zoho_client.start_background_leads_fetch()
+        leads = zoho_client.finish_background_leads_fetch(future)
+
+        assert leads == []
+        assert mock_st.session_state.zoho_error_type == zoho_client.ERROR_TYPE_TIMEOUT
+        assert "timed out" in mock_st.session_state.zoho_error
+
+    def test_background_401_refreshes_token_and_retries(self, mock_st, mock_requests):
+        """A 401 in the worker invalidates the token and refetches with a fresh one."""
+        mock_st.session_state.zoho_access_token = "revoked-token"
+        mock_st.session_state.zoho_token_expiry = (
+            datetime.now(timezone.utc).timestamp() + 3600
+        )
+        unauthorized = Mock()
+        unauthorized.status_code = 401
+        success = Mock()
+        success.status_code = 200
+        success.json.return_value = {"data": [{"id": "1"}]}
+        mock_requests.request.side_effect = [unauthorized, success]
+        token_response = Mock()
+        token_response.status_code = 200
+        token_response.json.return_value = {"access_token": "fresh-token", "expires_in": 3600}
+        mock_requests.post.return_value = token_response
+
+        future = zoho_client.start_background_leads_fetch()
+        leads = zoho_client.finish_background_leads_fetch(future)
+
+        assert [lead["id"] for lead in leads] == ["1"]
+        assert mock_st.session_state.zoho_access_token == "fresh-token"
+        headers = mock_requests.request.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Zoho-oauthtoken fresh-token"
+
+
+class TestBackgroundDeliveriesFetch:
+    """Tests for the deliveries fetch that overlaps the leads fetch."""
+
+    def test_fetch_from_api_with_prefetched_token(self, mock_st, mock_requests):
+        """Worker fetch uses the prefetched token and maps deliveries."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "data": [{"id": "d1", "Name": "Delivery", "Locatings": {"id": "123"}}]
+        }
+        mock_requests.request.return_value = mock_response
+
+        deliveries, error = zoho_client._fetch_deliveries_from_api(
+            "worker-token", "https://www.zohoapis.com"
+        )
+
+        assert error is None
+        assert deliveries[0]["id"] == "d1"
+        assert deliveries[0]["locating_id"] == "123"
+        headers = mock_requests.request.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Zoho-oauthtoken worker-token"
+
+    def test_finish_records_worker_error(self, mock_st):
+        """Failed background fetch returns empty list and records the worker's error."""
+        future = Mock()
+        future.result.return_value = (
+            None, ("Request timed out. Zoho may be slow. Please try again.", zoho_client.ERROR_TYPE_TIMEOUT)
+        )
+
+        deliveries = zoho_client.finish_background_deliveries_fetch(future)
+
+        assert deliveries == []
+        assert mock_st.session_state.zoho_error_type == zoho_client.ERROR_TYPE_TIMEOUT
+
+
 class TestErrorTypeHandling:
     """Tests for error type classification (Story 1.6)."""
 
@@ -1060,3 +1215,34 @@ class TestGetStageHistory:
         assert len(result) == 1
         assert result[0]["changed_at"] is not None
         assert isinstance(result[0]["changed_at"], datetime)
+
+
+class TestGetStageHistoriesBatch:
+    """Tests for get_stage_histories_batch failure reporting."""
+
+    def test_failed_ids_lists_only_failed_requests(self, mock_st):
+        """Leads whose API fetch failed are reported; successes are returned."""
+        leads = [{"id": "ok", "Stage": "Green"}, {"id": "bad", "Stage": "Green"}]
+
+        def fake_fetch(lead, token, domain):
+            return lead["id"], [] if lead["id"] == "ok" else None
+
+        failed_ids = set()
+        with patch.object(zoho_client, 'get_cached_stage_histories_batch', return_value={}), \
+                patch.object(zoho_client, 'set_cached_stage_histories_batch'), \
+                patch.object(zoho_client, '_fetch_stage_history_for_lead', side_effect=fake_fetch), \
+                patch.object(zoho_client, 'get_access_token', return_value='test-token'):
+            result = zoho_client.get_stage_histories_batch(leads, failed_ids=failed_ids)
+
+        assert result == {"ok": []}
+        assert failed_ids == {"bad"}
+
+    def test_no_token_reports_no_failures(self, mock_st):
+        """Leads skipped for lack of a token are not reported as failed."""
+        failed_ids = set()
+        with patch.object(zoho_client, 'get_cached_stage_histories_batch', return_value={}), \
+                patch.object(zoho_client, 'get_access_token', return_value=None):
+            result = zoho_client.get_stage_histories_batch([{"id": "1", "Stage": "Green"}], failed_ids=failed_ids)
+
+        assert result == {}
+        assert failed_ids == set()